@@ -6,15 +6,57 @@ Loads config from:
 2. .env (secrets like API keys)
 """
 
+import copy
 import os
 from pathlib import Path
 from typing import Any
 
-import yaml
-from dotenv import load_dotenv
+# .env is loaded on first config or secret lookup, not at import
+_dotenv_loaded = False
+
+# Default configuration (built once; hand out copies)
+_DEFAULT_CONFIG: dict[str, Any] = {
+    # Trading mode
+    "mode": "paper",  # paper | live
+
+    # Risk level (1-10 scale from DREAMPIVOT.md)
+    "risk_level": 1,  # Start ultra-safe
+
+    # Exchange settings
+    "exchange": {
+        "name": "binance",
+        "testnet": True,  # Use testnet for safety
+    },
+
+    # Trading pairs
+    "symbols": ["BTC/USDT"],
+
+    # Data collection
+    "timeframe": "1h",  # Candle timeframe
+    "history_days": 30,  # Days of history to load
+
+    # Strategy
+    "strategy": {
+        "name": "momentum",
+        "params": {
+            "fast_period": 12,
+            "slow_period": 26,
+            "signal_period": 9,
+        },
+    },
+
+    # Paper trading
+    "paper": {
+        "initial_balance": 10000.0,  # USDT
+        "fee_rate": 0.001,  # 0.1%
+    },
+
+    # Logging
+    "log_level": "INFO",
+}
 
-# Load .env file
-load_dotenv()
+# Parsed config files, keyed by (path, mtime_ns)
+_config_cache: dict[tuple[str, int], dict[str, Any]] = {}
 
 
 def get_project_root() -> Path:
@@ -22,8 +64,20 @@ def get_project_root() -> Path:
     return Path(__file__).parent.parent
 
 
+def _load_dotenv() -> None:
+    """Load .env into os.environ (once)."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _dotenv_loaded = True
+
+
 def load_config(config_path: str | None = None) -> dict[str, Any]:
-    """Load configuration from YAML file."""
+    """Load configuration from YAML file (and .env into the environment)."""
+    _load_dotenv()
+
     if config_path is None:
         config_path = get_project_root() / "config.yaml"
 
@@ -33,59 +87,32 @@ def load_config(config_path: str | None = None) -> dict[str, Any]:
         # Return defaults if no config file
         return get_default_config()
 
+    # Reuse the parsed file until it changes on disk
+    key = (str(config_path), config_path.stat().st_mtime_ns)
+    cached = _config_cache.get(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    import yaml
+
     with open(config_path, "r") as f:
         config = yaml.safe_load(f) or {}
 
-    # Merge with defaults
-    defaults = get_default_config()
-    return {**defaults, **config}
+    # Merge with defaults (cached dict is only ever handed out as a copy)
+    merged = {**_DEFAULT_CONFIG, **config}
+    _config_cache[key] = merged
+    return copy.deepcopy(merged)
 
 
 def get_default_config() -> dict[str, Any]:
     """Default configuration."""
-    return {
-        # Trading mode
-        "mode": "paper",  # paper | live
-
-        # Risk level (1-10 scale from DREAMPIVOT.md)
-        "risk_level": 1,  # Start ultra-safe
-
-        # Exchange settings
-        "exchange": {
-            "name": "binance",
-            "testnet": True,  # Use testnet for safety
-        },
-
-        # Trading pairs
-        "symbols": ["BTC/USDT"],
-
-        # Data collection
-        "timeframe": "1h",  # Candle timeframe
-        "history_days": 30,  # Days of history to load
-
-        # Strategy
-        "strategy": {
-            "name": "momentum",
-            "params": {
-                "fast_period": 12,
-                "slow_period": 26,
-                "signal_period": 9,
-            },
-        },
-
-        # Paper trading
-        "paper": {
-            "initial_balance": 10000.0,  # USDT
-            "fee_rate": 0.001,  # 0.1%
-        },
-
-        # Logging
-        "log_level": "INFO",
-    }
+    return copy.deepcopy(_DEFAULT_CONFIG)
 
 
 def get_api_keys(exchange: str) -> dict[str, str]:
     """Get API keys from environment variables."""
+    _load_dotenv()
+
     exchange_upper = exchange.upper()
     return {
         "api_key": os.getenv(f"{exchange_upper}_API_KEY", ""),
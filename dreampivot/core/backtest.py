@@ -9,15 +9,28 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
-from ..strategies.base import BaseStrategy, Signal
+from ..strategies.base import BaseStrategy, Signal, SIGNAL_CODES
+from ..utils.jit import njit
 from ..utils.logger import get_logger
 
 logger = get_logger("backtest")
 
+# Trade exit reasons
+REASON_SL = 1
+REASON_TP = 2
+REASON_SIGNAL = 3
 
-@dataclass
+# Encodings used by the compiled loop
+_SIDE_BUY = 1
+_SIDE_SELL = -1
+_SIGNAL_BUY = SIGNAL_CODES[Signal.BUY]
+_SIGNAL_SELL = SIGNAL_CODES[Signal.SELL]
+
+
+@dataclass(slots=True)
 class BacktestTrade:
     """Record of a backtested trade."""
     timestamp: datetime
@@ -27,9 +40,10 @@ class BacktestTrade:
     amount: float
     value: float
     reason: str
+    reason_code: int = REASON_SIGNAL  # REASON_SL, REASON_TP or REASON_SIGNAL
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestResult:
     """Results from a backtest run."""
     symbol: str
@@ -45,6 +59,135 @@ class BacktestResult:
     max_drawdown: float
     win_rate: float
     trades: list[BacktestTrade]
+    sl_count: int = 0  # Stop-loss exits
+    tp_count: int = 0  # Take-profit exits
+
+
+@njit(cache=True)
+def _run_backtest_numba(
+    high,
+    low,
+    close,
+    signals,
+    start_idx,
+    initial_balance,
+    pos_pct,
+    fee_rate,
+    sl_pct,
+    tp_pct,
+):
+    """
+    Simulate the stop-loss / take-profit / signal state machine.
+
+    Works only on NumPy arrays so numba can compile it. At most two trades
+    happen per candle (a stop exit followed by a new entry).
+
+    Returns:
+        Trade arrays (candle index, side, price, amount, value, reason code),
+        per-candle cash and position from start_idx, final cash balance and
+        open position
+    """
+    n = len(close)
+    capacity = 2 * n
+    trade_indices = np.empty(capacity, dtype=np.int64)
+    trade_sides = np.empty(capacity, dtype=np.int8)
+    trade_prices = np.empty(capacity, dtype=np.float64)
+    trade_amounts = np.empty(capacity, dtype=np.float64)
+    trade_values = np.empty(capacity, dtype=np.float64)
+    trade_reasons = np.empty(capacity, dtype=np.int8)
+    cash_history = np.empty(n - start_idx, dtype=np.float64)
+    position_history = np.empty(n - start_idx, dtype=np.float64)
+
+    balance = initial_balance
+    position = 0.0  # Amount of base currency held
+    entry_price = 0.0
+    k = 0
+
+    for i in range(start_idx, n):
+        current_price = close[i]
+
+        # Check stop-loss and take-profit first (if in position)
+        if position > 0 and entry_price > 0:
+            stop_price = entry_price * (1 - sl_pct)
+            take_price = entry_price * (1 + tp_pct)
+
+            exit_price = 0.0
+            exit_reason = 0
+            if low[i] <= stop_price:
+                exit_price = stop_price
+                exit_reason = REASON_SL
+            elif high[i] >= take_price:
+                exit_price = take_price
+                exit_reason = REASON_TP
+
+            if exit_reason != 0:
+                trade_value = position * exit_price
+                fee = trade_value * fee_rate
+                balance += trade_value - fee
+
+                trade_indices[k] = i
+                trade_sides[k] = _SIDE_SELL
+                trade_prices[k] = exit_price
+                trade_amounts[k] = position
+                trade_values[k] = trade_value
+                trade_reasons[k] = exit_reason
+                k += 1
+
+                position = 0.0
+                entry_price = 0.0
+
+        # Execute based on signal
+        signal = signals[i]
+        if signal == _SIGNAL_BUY and position == 0:
+            trade_value = balance * pos_pct
+            fee = trade_value * fee_rate
+            amount = (trade_value - fee) / current_price
+
+            position = amount
+            entry_price = current_price
+            balance -= trade_value
+
+            trade_indices[k] = i
+            trade_sides[k] = _SIDE_BUY
+            trade_prices[k] = current_price
+            trade_amounts[k] = amount
+            trade_values[k] = trade_value
+            trade_reasons[k] = REASON_SIGNAL
+            k += 1
+
+        elif signal == _SIGNAL_SELL and position > 0:
+            # Sell (strategy exit)
+            trade_value = position * current_price
+            fee = trade_value * fee_rate
+            balance += trade_value - fee
+
+            trade_indices[k] = i
+            trade_sides[k] = _SIDE_SELL
+            trade_prices[k] = current_price
+            trade_amounts[k] = position
+            trade_values[k] = trade_value
+            trade_reasons[k] = REASON_SIGNAL
+            k += 1
+
+            position = 0.0
+            entry_price = 0.0
+
+        # Track state (valued after the loop)
+        cash_history[i - start_idx] = balance
+        position_history[i - start_idx] = position
+
+    return (
+        trade_indices[:k],
+        trade_sides[:k],
+        trade_prices[:k],
+        trade_amounts[:k],
+        trade_values[:k],
+        trade_reasons[:k],
+        cash_history,
+        position_history,
+        balance,
+        position,
+    )
 
 
 class BacktestEngine:
@@ -82,121 +225,86 @@ class BacktestEngine:
         Returns:
             BacktestResult with performance metrics
         """
-        if len(df) < self.strategy.required_history():
-            raise ValueError(f"Need at least {self.strategy.required_history()} candles")
-
-        # State
-        balance = self.initial_balance
-        position = 0.0  # Amount of base currency held
-        entry_price = 0.0
-        trades: list[BacktestTrade] = []
-        balance_history = [balance]
-
-        # Walk through data
         start_idx = self.strategy.required_history()
+        if len(df) < start_idx:
+            raise ValueError(f"Need at least {start_idx} candles")
+
+        # Signals for every candle in one vectorized pass
+        signals, _confidences, reasons = self.strategy.analyze_series(df, symbol)
+
+        # Raw price arrays (avoid per-candle pandas indexing)
+        close = df["close"].to_numpy(dtype=np.float64)
+        high = df["high"].to_numpy(dtype=np.float64)
+        low = df["low"].to_numpy(dtype=np.float64)
+
+        # Simulate trades (compiled loop)
+        (
+            trade_indices,
+            trade_sides,
+            trade_prices,
+            trade_amounts,
+            trade_values,
+            trade_reasons,
+            cash_history,
+            position_history,
+            balance,
+            position,
+        ) = _run_backtest_numba(
+            high,
+            low,
+            close,
+            signals,
+            start_idx,
+            float(self.initial_balance),
+            float(self.position_size_pct),
+            float(self.fee_rate),
+            float(self.stop_loss_pct),
+            float(self.take_profit_pct),
+        )
 
-        for i in range(start_idx, len(df)):
-            # Get data up to current candle
-            current_data = df.iloc[:i+1].copy()
-            current_candle = df.iloc[i]
-            current_price = current_candle["close"]
-            current_high = current_candle["high"]
-            current_low = current_candle["low"]
-            current_time = current_data.index[-1] if isinstance(current_data.index[-1], datetime) else datetime.now(timezone.utc)
-
-            # Check stop-loss and take-profit first (if in position)
-            if position > 0 and entry_price > 0:
-                stop_price = entry_price * (1 - self.stop_loss_pct)
-                take_price = entry_price * (1 + self.take_profit_pct)
-
-                # Check if stop-loss hit (price went below stop)
-                if current_low <= stop_price:
-                    trade_value = position * stop_price
-                    fee = trade_value * self.fee_rate
-                    balance += trade_value - fee
-
-                    trades.append(BacktestTrade(
-                        timestamp=current_time,
-                        symbol=symbol,
-                        side="sell",
-                        price=stop_price,
-                        amount=position,
-                        value=trade_value,
-                        reason=f"Stop-loss hit ({self.stop_loss_pct:.1%})",
-                    ))
-
-                    position = 0
-                    entry_price = 0
-
-                # Check if take-profit hit (price went above target)
-                elif current_high >= take_price:
-                    trade_value = position * take_price
-                    fee = trade_value * self.fee_rate
-                    balance += trade_value - fee
-
-                    trades.append(BacktestTrade(
-                        timestamp=current_time,
-                        symbol=symbol,
-                        side="sell",
-                        price=take_price,
-                        amount=position,
-                        value=trade_value,
-                        reason=f"Take-profit hit ({self.take_profit_pct:.1%})",
-                    ))
-
-                    position = 0
-                    entry_price = 0
-
-            # Get signal (only if not in position or position was just closed)
-            signal = self.strategy.analyze(current_data, symbol)
-
-            # Execute based on signal
-            if signal.signal == Signal.BUY and position == 0:
-                # Buy
-                trade_value = balance * self.position_size_pct
-                fee = trade_value * self.fee_rate
-                amount = (trade_value - fee) / current_price
-
-                position = amount
-                entry_price = current_price
-                balance -= trade_value
-
-                trades.append(BacktestTrade(
-                    timestamp=current_time,
-                    symbol=symbol,
-                    side="buy",
-                    price=current_price,
-                    amount=amount,
-                    value=trade_value,
-                    reason=signal.reason,
-                ))
-
-            elif signal.signal == Signal.SELL and position > 0:
-                # Sell (strategy exit)
-                trade_value = position * current_price
-                fee = trade_value * self.fee_rate
-                balance += trade_value - fee
-
-                trades.append(BacktestTrade(
-                    timestamp=current_time,
-                    symbol=symbol,
-                    side="sell",
-                    price=current_price,
-                    amount=position,
-                    value=trade_value,
-                    reason=signal.reason,
-                ))
-
-                position = 0
-                entry_price = 0
-
-            # Track balance (including unrealized P&L)
-            total_value = balance + (position * current_price)
-            balance_history.append(total_value)
+        # Balance history (including unrealized P&L)
+        balance_history = np.empty(len(cash_history) + 1, dtype=np.float64)
+        balance_history[0] = self.initial_balance
+        balance_history[1:] = cash_history + position_history * close[start_idx:]
+
+        # Timestamps for trade candles only (resolved once, not per candle)
+        now = datetime.now(timezone.utc)
+        has_times = isinstance(df.index, pd.DatetimeIndex)
+        if has_times:
+            trade_times = list(df.index[trade_indices])
+        else:
+            trade_times = [now] * len(trade_indices)
+
+        # Build trade records outside the hot loop
+        exit_reasons = {
+            REASON_SL: f"Stop-loss hit ({self.stop_loss_pct:.1%})",
+            REASON_TP: f"Take-profit hit ({self.take_profit_pct:.1%})",
+        }
+        trades = [
+            BacktestTrade(
+                timestamp=timestamp,
+                symbol=symbol,
+                side="buy" if side == _SIDE_BUY else "sell",
+                price=price,
+                amount=amount,
+                value=value,
+                reason=exit_reasons.get(reason_code) or reasons[i],
+                reason_code=reason_code,
+            )
+            for i, timestamp, side, price, amount, value, reason_code in zip(
+                trade_indices.tolist(),
+                trade_times,
+                trade_sides.tolist(),
+                trade_prices.tolist(),
+                trade_amounts.tolist(),
+                trade_values.tolist(),
+                trade_reasons.tolist(),
+            )
+        ]
 
         # Close any open position at end
         if position > 0:
-            final_price = df["close"].iloc[-1]
+            final_price = close[-1]
             trade_value = position * final_price
             fee = trade_value * self.fee_rate
             balance += trade_value - fee
@@ -207,36 +315,24 @@ class BacktestEngine:
         total_pnl = final_balance - self.initial_balance
         pnl_percent = (total_pnl / self.initial_balance) * 100
 
-        # Calculate win/loss
-        winning = 0
-        losing = 0
-        buy_trades = [t for t in trades if t.side == "buy"]
-        sell_trades = [t for t in trades if t.side == "sell"]
-
-        for i, sell in enumerate(sell_trades):
-            if i < len(buy_trades):
-                buy = buy_trades[i]
-                if sell.price > buy.price:
-                    winning += 1
-                else:
-                    losing += 1
+        # Calculate win/loss (pair each sell with the buy before it)
+        buy_prices = trade_prices[trade_sides == _SIDE_BUY]
+        sell_prices = trade_prices[trade_sides == _SIDE_SELL]
+        paired = min(len(buy_prices), len(sell_prices))
+        winning = int((sell_prices[:paired] > buy_prices[:paired]).sum())
+        losing = paired - winning
+        sell_count = len(sell_prices)
 
         # Max drawdown
-        peak = balance_history[0]
-        max_drawdown = 0.0
-        for value in balance_history:
-            if value > peak:
-                peak = value
-            drawdown = (peak - value) / peak
-            if drawdown > max_drawdown:
-                max_drawdown = drawdown
+        peak = np.maximum.accumulate(balance_history)
+        max_drawdown = float(((peak - balance_history) / peak).max())
 
-        win_rate = (winning / len(sell_trades) * 100) if sell_trades else 0.0
+        win_rate = (winning / sell_count * 100) if sell_count else 0.0
 
         return BacktestResult(
             symbol=symbol,
-            start_date=df.index[0] if isinstance(df.index[0], datetime) else datetime.now(timezone.utc),
-            end_date=df.index[-1] if isinstance(df.index[-1], datetime) else datetime.now(timezone.utc),
+            start_date=df.index[0] if has_times else now,
+            end_date=df.index[-1] if has_times else now,
             initial_balance=self.initial_balance,
             final_balance=final_balance,
             total_trades=len(trades),
@@ -247,14 +343,15 @@ class BacktestEngine:
             max_drawdown=max_drawdown * 100,
             win_rate=win_rate,
             trades=trades,
+            sl_count=int(np.count_nonzero(trade_reasons == REASON_SL)),
+            tp_count=int(np.count_nonzero(trade_reasons == REASON_TP)),
         )
 
 
 def format_backtest_result(result: BacktestResult) -> str:
     """Format backtest result for display."""
-    # Count stop-loss and take-profit exits
-    sl_count = len([t for t in result.trades if "Stop-loss" in t.reason])
-    tp_count = len([t for t in result.trades if "Take-profit" in t.reason])
+    sl_count = result.sl_count
+    tp_count = result.tp_count
 
     lines = [
         "=" * 50,
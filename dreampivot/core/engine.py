@@ -10,14 +10,15 @@ The heart of DREAMPIVOT - coordinates everything:
 """
 
 import asyncio
+import os
 from datetime import datetime, timezone
 from typing import Any
 
+import pandas as pd
+
 from ..exchanges.base import BaseExchange
 from ..exchanges.factory import create_exchange
 from ..strategies.base import BaseStrategy, Signal
-from ..strategies.momentum import MomentumStrategy
-from ..strategies.mean_reversion import MeanReversionStrategy
 from ..utils.logger import get_logger
 from ..utils.tracker import PerformanceTracker
 
@@ -47,6 +48,15 @@ class TradingEngine:
         # State
         self._running = False
         self._positions: dict[str, float] = {}  # symbol -> amount
+        self._symbol_parts: dict[str, tuple[str, str]] = {}  # symbol -> (base, quote)
+
+        # Symbols are analyzed concurrently, but orders go one at a time so
+        # each is sized from the balance left by the previous one
+        self._order_lock = asyncio.Lock()
+
+        # Live data caches (symbol -> recent candles / strategy state)
+        self._ohlcv_cache: dict[str, pd.DataFrame] = {}
+        self._indicator_state: dict[str, Any] = {}
 
         # Risk settings (from 1-10 knob, start at 1 = ultra safe)
         self._risk_level = config.get("risk_level", 1)
@@ -81,13 +91,22 @@ class TradingEngine:
         strategy_config = self.config.get("strategy", {})
         strategy_name = strategy_config.get("name", "momentum")
 
+        # Import only the selected strategy
         if strategy_name == "momentum":
+            from ..strategies.momentum import MomentumStrategy
             self._strategy = MomentumStrategy(strategy_config.get("params", {}))
         elif strategy_name == "mean_reversion":
+            from ..strategies.mean_reversion import MeanReversionStrategy
             self._strategy = MeanReversionStrategy(strategy_config.get("params", {}))
         else:
             raise ValueError(f"Unknown strategy: {strategy_name}. Available: momentum, mean_reversion")
 
+        # The kernels may have been imported (skipping their import-time
+        # warmup) before load_config read .env, so check the flag again
+        if os.getenv("DREAMPIVOT_WARMUP") == "1":
+            from ..utils.indicators import warmup
+            warmup()
+
         logger.info(f"Strategy: {self._strategy.name}")
         logger.info(f"Risk Level: {self._risk_level}/10 (position size: {self._position_size_pct:.1%})")
         logger.info(f"Symbols: {self.config.get('symbols', [])}")
@@ -102,6 +121,8 @@ class TradingEngine:
         if self._exchange:
             await self._exchange.disconnect()
 
+        self._tracker.close()
+
         logger.info("Engine stopped")
 
     async def run_once(self) -> dict[str, Any]:
@@ -118,31 +139,35 @@ class TradingEngine:
         symbols = self.config.get("symbols", ["BTC/USDT"])
         timeframe = self.config.get("timeframe", "1h")
 
-        for symbol in symbols:
-            try:
-                result = await self._process_symbol(symbol, timeframe)
+        # Process all symbols concurrently (network-bound)
+        done = await asyncio.gather(
+            *[self._process_symbol(symbol, timeframe) for symbol in symbols],
+            return_exceptions=True,
+        )
+
+        for symbol, result in zip(symbols, done):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                logger.error(f"Error processing {symbol}: {result}")
+                results[symbol] = {"error": str(result)}
+            else:
                 results[symbol] = result
-            except Exception as e:
-                logger.error(f"Error processing {symbol}: {e}")
-                results[symbol] = {"error": str(e)}
 
         return results
 
     async def _process_symbol(self, symbol: str, timeframe: str) -> dict[str, Any]:
         """Process a single trading pair."""
         # Get price data
-        ohlcv = await self._exchange.get_ohlcv(
-            symbol,
-            timeframe,
-            limit=self._strategy.required_history() + 10,
-        )
-        df = self._exchange.ohlcv_to_dataframe(ohlcv)
+        df = await self._get_candles(symbol, timeframe)
 
         if df.empty:
             return {"signal": "hold", "reason": "No data"}
 
         # Run strategy
-        trade_signal = self._strategy.analyze(df, symbol)
+        trade_signal = self._strategy.update_incremental(
+            self._indicator_state.setdefault(symbol, {}), df, symbol
+        )
 
         result = {
             "symbol": symbol,
@@ -162,7 +187,8 @@ class TradingEngine:
 
         if trade_signal.signal != Signal.HOLD and trade_signal.confidence >= min_confidence:
             try:
-                order = await self._execute_signal(trade_signal)
+                async with self._order_lock:
+                    order = await self._execute_signal(trade_signal)
                 result["order"] = {
                     "id": order.id,
                     "side": order.side,
@@ -195,6 +221,40 @@ class TradingEngine:
 
         return result
 
+    async def _get_candles(self, symbol: str, timeframe: str) -> pd.DataFrame:
+        """
+        Get recent candles, refreshing only the newest ones once cached.
+
+        The full window is fetched on first use or when the cached data
+        no longer overlaps the latest candles.
+        """
+        window = self._strategy.required_history() + 10
+        cached = self._ohlcv_cache.get(symbol)
+
+        df = None
+        if cached is not None:
+            latest = await self._exchange.get_ohlcv_frame(
+                symbol, timeframe, limit=2, dtype="float64"
+            )
+            if not latest.empty and latest.index[0] <= cached.index[-1]:
+                # Newer rows replace the (possibly unfinished) cached tail;
+                # binary search for the cut point, so no dedup pass needed
+                cut = cached.index.searchsorted(latest.index[0], side="left")
+                df = pd.concat([cached.iloc[:cut], latest]).iloc[-window:]
+
+        if df is None:
+            df = await self._exchange.get_ohlcv_frame(
+                symbol,
+                timeframe,
+                limit=window,
+                dtype="float64",  # Keep exact prices for live orders
+            )
+
+        if not df.empty:
+            self._ohlcv_cache[symbol] = df
+
+        return df
+
     def _get_min_confidence(self) -> float:
         """Get minimum confidence threshold based on risk level."""
         # Higher risk = lower confidence threshold
@@ -204,11 +264,8 @@ class TradingEngine:
     async def _execute_signal(self, signal) -> Any:
         """Execute a trade signal."""
         # Get balance
-        balances = await self._exchange.get_balance()
-        usdt_balance = next(
-            (b for b in balances if b.currency == "USDT"),
-            None
-        )
+        balances = await self._exchange.get_balances_map()
+        usdt_balance = balances.get("USDT")
 
         if not usdt_balance:
             raise ValueError("No USDT balance")
@@ -227,24 +284,31 @@ class TradingEngine:
                 side="buy",
                 order_type="market",
                 amount=amount,
+                last_price=price,
             )
         elif signal.signal == Signal.SELL:
             # Check if we have position to sell
-            base_currency = signal.symbol.split("/")[0]
-            base_balance = next(
-                (b for b in balances if b.currency == base_currency),
-                None
-            )
+            base_currency, _ = self._split_symbol(signal.symbol)
+            base_balance = balances.get(base_currency)
             if base_balance and base_balance.free > 0:
                 return await self._exchange.create_order(
                     symbol=signal.symbol,
                     side="sell",
                     order_type="market",
                     amount=base_balance.free,
+                    last_price=price,
                 )
             else:
                 raise ValueError(f"No {base_currency} to sell")
 
+    def _split_symbol(self, symbol: str) -> tuple[str, str]:
+        """Split "BTC/USDT" into ("BTC", "USDT"), cached per symbol."""
+        parts = self._symbol_parts.get(symbol)
+        if parts is None:
+            base, quote = symbol.split("/")
+            parts = self._symbol_parts[symbol] = (base, quote)
+        return parts
+
     async def run_loop(self, interval_seconds: int = 60) -> None:
         """
         Run continuous trading loop.
@@ -6,6 +6,6 @@ Uses ccxt for crypto exchanges.
 """
 
 from .base import BaseExchange
-from .factory import create_exchange
+from .factory import create_exchange, disconnect_all
 
-__all__ = ["BaseExchange", "create_exchange"]
+__all__ = ["BaseExchange", "create_exchange", "disconnect_all"]
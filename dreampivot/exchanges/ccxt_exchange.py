@@ -6,16 +6,32 @@ Supports all exchanges that ccxt supports:
 - Unified interface for all
 """
 
+import operator
+import time
 from datetime import datetime, timezone
-from typing import Literal
+from typing import Any, Literal
 
 import ccxt.async_support as ccxt
+import numpy as np
+import pandas as pd
 
 from .base import BaseExchange, Ticker, OHLCV, Order, Balance
+from ..utils import ohlcv_cache
 from ..utils.logger import get_logger
+from ..utils.rate_limit import RateLimiter
 
 logger = get_logger("exchange")
 
+_UTC = timezone.utc
+
+# Unified ccxt ticker fields, looked up in one call
+_TICKER_FIELDS = operator.itemgetter("bid", "ask", "last", "quoteVolume", "timestamp")
+
+
+def _ts_ms(ms: int) -> datetime:
+    """Convert a ccxt millisecond timestamp to an aware UTC datetime."""
+    return datetime.fromtimestamp(ms * 0.001, _UTC)
+
 
 class CCXTExchange(BaseExchange):
     """
@@ -44,6 +60,8 @@ class CCXTExchange(BaseExchange):
         api_key: str = "",
         secret: str = "",
         testnet: bool = True,
+        cache_ohlcv: bool = False,
+        limiter: RateLimiter | None = None,
     ):
         super().__init__(api_key, secret, testnet)
 
@@ -58,6 +76,12 @@ class CCXTExchange(BaseExchange):
         self._exchange_class = self.SUPPORTED[self._name]
         self._exchange: ccxt.Exchange | None = None
 
+        # On-disk candle cache (for backtests; live trading wants fresh data)
+        self._cache_ohlcv = cache_ohlcv
+
+        # Request limiter (shared per exchange when created by the factory)
+        self._limiter = limiter or RateLimiter()
+
     async def connect(self) -> None:
         """Initialize connection to exchange."""
         config = {
@@ -75,6 +99,9 @@ class CCXTExchange(BaseExchange):
 
         self._exchange = self._exchange_class(config)
 
+        # Space requests by the exchange's documented limit (ms -> s)
+        self._limiter.slow_to(self._exchange.rateLimit / 1000)
+
         # Load markets
         await self._exchange.load_markets()
         logger.info(f"Connected to {self._name} ({'testnet' if self.testnet else 'live'})")
@@ -96,7 +123,8 @@ class CCXTExchange(BaseExchange):
         """Get current price for symbol."""
         self._ensure_connected()
 
-        ticker = await self._exchange.fetch_ticker(symbol)
+        async with self._limiter:
+            ticker = await self._exchange.fetch_ticker(symbol)
 
         return Ticker(
             symbol=symbol,
@@ -104,9 +132,10 @@ class CCXTExchange(BaseExchange):
             ask=float(ticker.get("ask", 0) or 0),
             last=float(ticker.get("last", 0) or 0),
             volume=float(ticker.get("baseVolume", 0) or 0),
-            timestamp=datetime.fromtimestamp(
-                ticker["timestamp"] / 1000, tz=timezone.utc
-            ) if ticker.get("timestamp") else datetime.now(timezone.utc),
+            timestamp=(
+                _ts_ms(ticker["timestamp"])
+                if ticker.get("timestamp") else datetime.now(_UTC)
+            ),
         )
 
     async def get_ohlcv(
@@ -116,22 +145,104 @@ class CCXTExchange(BaseExchange):
         limit: int = 100,
     ) -> list[OHLCV]:
         """Get candlestick data."""
-        self._ensure_connected()
-
-        data = await self._exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+        df = await self.get_ohlcv_frame(symbol, timeframe, limit, dtype="float64")
 
+        # Materialize dataclasses from the vectorized frame
         return [
             OHLCV(
-                timestamp=datetime.fromtimestamp(candle[0] / 1000, tz=timezone.utc),
-                open=float(candle[1]),
-                high=float(candle[2]),
-                low=float(candle[3]),
-                close=float(candle[4]),
-                volume=float(candle[5]),
+                timestamp=timestamp,
+                open=open_,
+                high=high,
+                low=low,
+                close=close,
+                volume=volume,
+            )
+            for timestamp, open_, high, low, close, volume in zip(
+                df.index.to_pydatetime(),
+                df["open"].tolist(),
+                df["high"].tolist(),
+                df["low"].tolist(),
+                df["close"].tolist(),
+                df["volume"].tolist(),
             )
-            for candle in data
         ]
 
+    async def get_ohlcv_frame(
+        self,
+        symbol: str,
+        timeframe: str = "1h",
+        limit: int = 100,
+        dtype: str = "float32",
+    ) -> pd.DataFrame:
+        """Get candlestick data as a DataFrame, built straight from ccxt rows."""
+        self._ensure_connected()
+
+        data = await self._fetch_ohlcv_rows(symbol, timeframe, limit)
+
+        # One float array for all rows; columns are slices of it
+        arr = np.asarray(data, dtype=np.float64).reshape(-1, 6)
+        index = pd.to_datetime(arr[:, 0].astype(np.int64), unit="ms", utc=True)
+
+        return pd.DataFrame(
+            {
+                "open": arr[:, 1],
+                "high": arr[:, 2],
+                "low": arr[:, 3],
+                "close": arr[:, 4],
+                "volume": arr[:, 5],
+            },
+            index=index.rename("timestamp"),
+            dtype=dtype,
+        )
+
+    async def _fetch_ohlcv_rows(
+        self,
+        symbol: str,
+        timeframe: str,
+        limit: int,
+    ) -> list[list[Any]]:
+        """
+        Fetch raw ccxt candle rows, using the on-disk cache if enabled.
+
+        Cached rows are returned as-is for one candle period. After that
+        only the missing suffix is fetched (starting at the last cached
+        candle, which may have been unfinished) and merged in.
+        """
+        if not self._cache_ohlcv:
+            return await self._fetch_ohlcv(symbol, timeframe, limit=limit)
+
+        key = ohlcv_cache.cache_key(self._name, symbol, timeframe, limit)
+        cached = ohlcv_cache.load(key)
+        period_ms = self._exchange.parse_timeframe(timeframe) * 1000
+        now = time.time()
+
+        rows = None
+        if cached:
+            cached_rows, fetched_at = cached
+            if (now - fetched_at) * 1000 < period_ms and len(cached_rows) >= limit:
+                return cached_rows[-limit:]
+
+            last_ts = cached_rows[-1][0]
+            if now * 1000 - last_ts < period_ms * limit:
+                fresh = await self._fetch_ohlcv(
+                    symbol, timeframe, since=last_ts, limit=limit
+                )
+                if fresh and fresh[0][0] <= last_ts:
+                    # Fresh rows overwrite the cached tail from their first timestamp
+                    keep = [row for row in cached_rows if row[0] < fresh[0][0]]
+                    rows = (keep + fresh)[-limit:]
+
+        if rows is None:
+            rows = await self._fetch_ohlcv(symbol, timeframe, limit=limit)
+
+        ohlcv_cache.store(key, rows, now)
+        return rows
+
+    async def _fetch_ohlcv(self, symbol: str, timeframe: str, **kwargs) -> list[list[Any]]:
+        """Rate-limited ccxt fetch_ohlcv."""
+        async with self._limiter:
+            return await self._exchange.fetch_ohlcv(symbol, timeframe, **kwargs)
+
     async def get_balance(self, currency: str | None = None) -> list[Balance]:
         """Get account balance."""
         self._ensure_connected()
@@ -160,8 +271,9 @@ class CCXTExchange(BaseExchange):
         order_type: Literal["market", "limit"],
         amount: float,
         price: float | None = None,
+        last_price: float | None = None,
     ) -> Order:
-        """Place an order."""
+        """Place an order (last_price is unused; the exchange fills it)."""
         self._ensure_connected()
 
         order = await self._exchange.create_order(
@@ -172,7 +284,7 @@ class CCXTExchange(BaseExchange):
             price=price,
         )
 
-        logger.info(f"Order created: {side} {amount} {symbol} @ {price or 'market'}")
+        logger.info("Order created: {} {} {} @ {}", side, amount, symbol, price or "market")
 
         return Order(
             id=order["id"],
@@ -182,9 +294,10 @@ class CCXTExchange(BaseExchange):
             amount=amount,
             price=price or float(order.get("price", 0) or 0),
             status=order["status"],
-            timestamp=datetime.fromtimestamp(
-                order["timestamp"] / 1000, tz=timezone.utc
-            ) if order.get("timestamp") else datetime.now(timezone.utc),
+            timestamp=(
+                _ts_ms(order["timestamp"])
+                if order.get("timestamp") else datetime.now(_UTC)
+            ),
         )
 
     async def cancel_order(self, order_id: str, symbol: str) -> bool:
@@ -213,29 +326,31 @@ class CCXTExchange(BaseExchange):
             amount=float(order["amount"]),
             price=float(order.get("price", 0) or 0),
             status=order["status"],
-            timestamp=datetime.fromtimestamp(
-                order["timestamp"] / 1000, tz=timezone.utc
-            ) if order.get("timestamp") else datetime.now(timezone.utc),
+            timestamp=(
+                _ts_ms(order["timestamp"])
+                if order.get("timestamp") else datetime.now(_UTC)
+            ),
         )
 
     async def get_all_tickers(self) -> dict[str, Ticker]:
         """Get all tickers (for finding hot pairs)."""
         self._ensure_connected()
 
-        tickers = await self._exchange.fetch_tickers()
+        async with self._limiter:
+            tickers = await self._exchange.fetch_tickers()
 
+        now = datetime.now(_UTC)
         result = {}
         for symbol, ticker in tickers.items():
-            if ticker.get("last"):
+            bid, ask, last, volume, ts = _TICKER_FIELDS(ticker)
+            if last:
                 result[symbol] = Ticker(
                     symbol=symbol,
-                    bid=float(ticker.get("bid", 0) or 0),
-                    ask=float(ticker.get("ask", 0) or 0),
-                    last=float(ticker.get("last", 0) or 0),
-                    volume=float(ticker.get("quoteVolume", 0) or 0),
-                    timestamp=datetime.fromtimestamp(
-                        ticker["timestamp"] / 1000, tz=timezone.utc
-                    ) if ticker.get("timestamp") else datetime.now(timezone.utc),
+                    bid=float(bid or 0),
+                    ask=float(ask or 0),
+                    last=float(last),
+                    volume=float(volume or 0),
+                    timestamp=_ts_ms(ts) if ts else now,
                 )
 
         return result
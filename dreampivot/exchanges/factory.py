@@ -4,9 +4,15 @@ Exchange Factory
 Creates exchange instances based on configuration.
 """
 
+import asyncio
+
 from .base import BaseExchange
 from .ccxt_exchange import CCXTExchange
 from .paper import PaperExchange
+from ..utils.rate_limit import RateLimiter
+
+# One limiter per exchange name, shared by every instance
+_LIMITERS: dict[str, RateLimiter] = {}
 
 
 def create_exchange(
@@ -16,6 +22,7 @@ def create_exchange(
     testnet: bool = True,
     paper_mode: bool = False,
     paper_balance: float = 10000.0,
+    cache_ohlcv: bool = False,
 ) -> BaseExchange:
     """
     Create an exchange instance.
@@ -27,15 +34,28 @@ def create_exchange(
         testnet: Use testnet/sandbox mode
         paper_mode: Use paper trading (simulated)
         paper_balance: Initial balance for paper trading
+        cache_ohlcv: Cache candles on disk (for backtests)
 
     Returns:
         Exchange instance
     """
     name = name.lower()
+    limiter = _LIMITERS.setdefault(name, RateLimiter())
+
+    exchange = CCXTExchange(
+        name, api_key, secret, testnet, cache_ohlcv=cache_ohlcv, limiter=limiter
+    )
 
     if paper_mode:
         # Paper trading - wrap real exchange for price data
-        real_exchange = CCXTExchange(name, api_key, secret, testnet)
-        return PaperExchange(real_exchange, initial_balance=paper_balance)
+        return PaperExchange(exchange, initial_balance=paper_balance)
+
+    return exchange
+
 
-    return CCXTExchange(name, api_key, secret, testnet)
+async def disconnect_all(exchanges: list[BaseExchange]) -> None:
+    """Disconnect exchanges concurrently, ignoring individual failures."""
+    await asyncio.gather(
+        *[exchange.disconnect() for exchange in exchanges],
+        return_exceptions=True,
+    )
@@ -9,6 +9,9 @@ from datetime import datetime, timezone
 from typing import Literal
 import uuid
 
+import numpy as np
+import pandas as pd
+
 from .base import BaseExchange, Ticker, OHLCV, Order, Balance
 from ..utils.logger import get_logger
 
@@ -35,27 +38,32 @@ class PaperExchange(BaseExchange):
 
         self._fee_rate = fee_rate
 
-        # Simulated balances (quote currency, usually USDT)
-        self._balances: dict[str, Balance] = {
-            "USDT": Balance(
-                currency="USDT",
-                free=initial_balance,
-                used=0.0,
-                total=initial_balance,
-            )
-        }
+        # Simulated balances (quote currency, usually USDT), kept as plain
+        # floats; the getters hand out fresh Balance snapshots
+        self._free: dict[str, float] = {"USDT": initial_balance}
+        self._total: dict[str, float] = {"USDT": initial_balance}
 
         # Order tracking
         self._orders: dict[str, Order] = {}
         self._order_counter = 0
 
-        # Trade history
-        self._trades: list[dict] = []
+        # Parsed symbols ("BTC/USDT" -> ("BTC", "USDT"))
+        self._symbol_parts: dict[str, tuple[str, str]] = {}
+
+        # Trade history (struct-of-arrays, capacity doubles when full)
+        self._n_trades = 0
+        self._alloc_trades(256)
+
+        # Running totals for get_stats
+        self._total_cost = 0.0
+        self._total_fee = 0.0
+        self._n_buys = 0
+        self._n_sells = 0
 
     async def connect(self) -> None:
         """Connect underlying exchange for price data."""
         await self._real.connect()
-        logger.info(f"Paper trading mode: ${self._balances['USDT'].total:.2f} USDT")
+        logger.info(f"Paper trading mode: ${self._total['USDT']:.2f} USDT")
 
     async def disconnect(self) -> None:
         """Disconnect."""
@@ -74,14 +82,37 @@ class PaperExchange(BaseExchange):
         """Get real candle data."""
         return await self._real.get_ohlcv(symbol, timeframe, limit)
 
+    async def get_ohlcv_frame(
+        self,
+        symbol: str,
+        timeframe: str = "1h",
+        limit: int = 100,
+        dtype: str = "float32",
+    ) -> pd.DataFrame:
+        """Get real candle data as a DataFrame."""
+        return await self._real.get_ohlcv_frame(symbol, timeframe, limit, dtype=dtype)
+
     async def get_balance(self, currency: str | None = None) -> list[Balance]:
         """Get simulated balance."""
         if currency:
-            if currency in self._balances:
-                return [self._balances[currency]]
+            if currency in self._free:
+                return [self._balance(currency)]
             return []
 
-        return list(self._balances.values())
+        return [self._balance(c) for c in self._free]
+
+    async def get_balances_map(self) -> dict[str, Balance]:
+        """Get simulated balance keyed by currency."""
+        return {c: self._balance(c) for c in self._free}
+
+    def _balance(self, currency: str) -> Balance:
+        """Snapshot of one simulated balance."""
+        return Balance(
+            currency=currency,
+            free=self._free[currency],
+            used=0.0,
+            total=self._total[currency],
+        )
 
     async def create_order(
         self,
@@ -90,14 +121,30 @@ class PaperExchange(BaseExchange):
         order_type: Literal["market", "limit"],
         amount: float,
         price: float | None = None,
+        last_price: float | None = None,
     ) -> Order:
-        """Simulate order execution."""
-        # Get current price
-        ticker = await self.get_ticker(symbol)
-        exec_price = price if order_type == "limit" else ticker.last
+        """
+        Simulate order execution.
+
+        Limit orders fill at `price` without touching the real exchange.
+        Market orders fill at `last_price` if the caller already has one,
+        otherwise at the live ticker.
+        """
+        if order_type == "market":
+            if last_price is None:
+                ticker = await self.get_ticker(symbol)
+                last_price = ticker.last
+            exec_price = last_price
+        else:
+            if price is None:
+                raise ValueError("Limit order requires a price")
+            exec_price = price
 
         # Parse symbol (e.g., "BTC/USDT" -> base="BTC", quote="USDT")
-        base, quote = symbol.split("/")
+        parts = self._symbol_parts.get(symbol)
+        if parts is None:
+            parts = self._symbol_parts[symbol] = tuple(symbol.split("/"))
+        base, quote = parts
 
         # Calculate cost
         cost = amount * exec_price
@@ -106,7 +153,7 @@ class PaperExchange(BaseExchange):
         # Check balance
         if side == "buy":
             required = cost + fee
-            if self._balances.get(quote, Balance(quote, 0, 0, 0)).free < required:
+            if self._free.get(quote, 0.0) < required:
                 raise ValueError(f"Insufficient {quote} balance. Need {required:.2f}")
 
             # Update balances
@@ -114,7 +161,7 @@ class PaperExchange(BaseExchange):
             self._update_balance(base, amount)
 
         else:  # sell
-            if self._balances.get(base, Balance(base, 0, 0, 0)).free < amount:
+            if self._free.get(base, 0.0) < amount:
                 raise ValueError(f"Insufficient {base} balance. Need {amount}")
 
             # Update balances
@@ -139,20 +186,12 @@ class PaperExchange(BaseExchange):
         self._orders[order_id] = order
 
         # Record trade
-        self._trades.append({
-            "id": order_id,
-            "symbol": symbol,
-            "side": side,
-            "amount": amount,
-            "price": exec_price,
-            "cost": cost,
-            "fee": fee,
-            "timestamp": order.timestamp,
-        })
+        self._record_trade(order, cost, fee)
 
+        # loguru formats the args only if a handler accepts INFO
         logger.info(
-            f"[PAPER] {side.upper()} {amount:.6f} {base} @ ${exec_price:.2f} "
-            f"(cost: ${cost:.2f}, fee: ${fee:.2f})"
+            "[PAPER] {} {:.6f} {} @ ${:.2f} (cost: ${:.2f}, fee: ${:.2f})",
+            side.upper(), amount, base, exec_price, cost, fee,
         )
 
         return order
@@ -170,26 +209,56 @@ class PaperExchange(BaseExchange):
             raise ValueError(f"Order {order_id} not found")
         return self._orders[order_id]
 
+    def _alloc_trades(self, capacity: int) -> None:
+        """(Re)allocate trade arrays, keeping recorded trades."""
+        n = self._n_trades
+        old = getattr(self, "_trade_cost", None)
+
+        columns = {
+            "_trade_id": object,
+            "_trade_symbol": object,
+            "_trade_side": object,
+            "_trade_timestamp": object,
+            "_trade_amount": np.float64,
+            "_trade_price": np.float64,
+            "_trade_cost": np.float64,
+            "_trade_fee": np.float64,
+        }
+        for attr, dtype in columns.items():
+            arr = np.empty(capacity, dtype=dtype)
+            if old is not None:
+                arr[:n] = getattr(self, attr)[:n]
+            setattr(self, attr, arr)
+
+        self._trade_capacity = capacity
+
+    def _record_trade(self, order: Order, cost: float, fee: float) -> None:
+        """Append a filled order to the trade arrays."""
+        if self._n_trades == self._trade_capacity:
+            self._alloc_trades(self._trade_capacity * 2)
+
+        n = self._n_trades
+        self._trade_id[n] = order.id
+        self._trade_symbol[n] = order.symbol
+        self._trade_side[n] = order.side
+        self._trade_timestamp[n] = order.timestamp
+        self._trade_amount[n] = order.amount
+        self._trade_price[n] = order.price
+        self._trade_cost[n] = cost
+        self._trade_fee[n] = fee
+        self._n_trades = n + 1
+
+        self._total_cost += cost
+        self._total_fee += fee
+        if order.side == "buy":
+            self._n_buys += 1
+        else:
+            self._n_sells += 1
+
     def _update_balance(self, currency: str, delta: float) -> None:
         """Update balance for a currency."""
-        if currency not in self._balances:
-            self._balances[currency] = Balance(
-                currency=currency,
-                free=0.0,
-                used=0.0,
-                total=0.0,
-            )
-
-        bal = self._balances[currency]
-        new_free = bal.free + delta
-        new_total = bal.total + delta
-
-        self._balances[currency] = Balance(
-            currency=currency,
-            free=max(0, new_free),
-            used=bal.used,
-            total=max(0, new_total),
-        )
+        self._free[currency] = max(0.0, self._free.get(currency, 0.0) + delta)
+        self._total[currency] = max(0.0, self._total.get(currency, 0.0) + delta)
 
     def get_portfolio_value(self, prices: dict[str, float]) -> float:
         """
@@ -200,21 +269,57 @@ class PaperExchange(BaseExchange):
         """
         total = 0.0
 
-        for currency, balance in self._balances.items():
+        for currency, amount in self._total.items():
             if currency == "USDT":
-                total += balance.total
+                total += amount
             elif currency in prices:
-                total += balance.total * prices[currency]
+                total += amount * prices[currency]
 
         return total
 
     def get_trade_history(self) -> list[dict]:
         """Get all paper trades."""
-        return self._trades.copy()
+        n = self._n_trades
+        return [
+            {
+                "id": order_id,
+                "symbol": symbol,
+                "side": side,
+                "amount": amount,
+                "price": price,
+                "cost": cost,
+                "fee": fee,
+                "timestamp": timestamp,
+            }
+            for order_id, symbol, side, amount, price, cost, fee, timestamp in zip(
+                self._trade_id[:n],
+                self._trade_symbol[:n],
+                self._trade_side[:n],
+                self._trade_amount[:n].tolist(),
+                self._trade_price[:n].tolist(),
+                self._trade_cost[:n].tolist(),
+                self._trade_fee[:n].tolist(),
+                self._trade_timestamp[:n],
+            )
+        ]
+
+    def get_trade_frame(self) -> pd.DataFrame:
+        """Get all paper trades as a DataFrame (one row per trade)."""
+        n = self._n_trades
+        return pd.DataFrame({
+            "id": self._trade_id[:n],
+            "symbol": self._trade_symbol[:n],
+            "side": self._trade_side[:n],
+            "amount": self._trade_amount[:n],
+            "price": self._trade_price[:n],
+            "cost": self._trade_cost[:n],
+            "fee": self._trade_fee[:n],
+            "timestamp": self._trade_timestamp[:n],
+        })
 
     def get_stats(self) -> dict:
         """Get trading statistics."""
-        if not self._trades:
+        if not self._n_trades:
             return {
                 "total_trades": 0,
                 "total_volume": 0,
@@ -222,9 +327,9 @@ class PaperExchange(BaseExchange):
             }
 
         return {
-            "total_trades": len(self._trades),
-            "total_volume": sum(t["cost"] for t in self._trades),
-            "total_fees": sum(t["fee"] for t in self._trades),
-            "buys": len([t for t in self._trades if t["side"] == "buy"]),
-            "sells": len([t for t in self._trades if t["side"] == "sell"]),
+            "total_trades": self._n_trades,
+            "total_volume": self._total_cost,
+            "total_fees": self._total_fee,
+            "buys": self._n_buys,
+            "sells": self._n_sells,
         }
@@ -10,12 +10,14 @@ Run with:
 import asyncio
 import argparse
 
+import pandas as pd
+
 from .config import load_config
 from .core.engine import TradingEngine
-from .core.backtest import BacktestEngine, format_backtest_result
+from .core.backtest import BacktestEngine, BacktestResult, format_backtest_result
 from .strategies.momentum import MomentumStrategy
 from .strategies.mean_reversion import MeanReversionStrategy
-from .exchanges.factory import create_exchange
+from .exchanges.factory import create_exchange, disconnect_all
 from .utils.logger import setup_logger, get_logger
 
 
@@ -110,109 +112,140 @@ async def run_backtest(days: int = 30, compare: bool = False) -> None:
         name=exchange_config.get("name", "binance"),
         testnet=False,
         paper_mode=False,
+        cache_ohlcv=config.get("backtest", {}).get("cache", True),
     )
 
-    await exchange.connect()
-
-    # Risk settings
-    risk_level = config.get("risk_level", 3)
-    risk_config = config.get("risk", {})
-    initial_balance = config.get("paper", {}).get("initial_balance", 10000.0)
-    fee_rate = config.get("paper", {}).get("fee_rate", 0.001)
-    stop_loss = risk_config.get("stop_loss", 0.02)
-    take_profit = risk_config.get("take_profit", 0.04)
-
-    logger.info(f"Risk: SL={stop_loss:.1%} | TP={take_profit:.1%}")
-
-    # Strategies to test
-    if compare:
-        strategies = [
-            ("momentum", MomentumStrategy(config.get("strategy", {}).get("params", {}))),
-            ("mean_reversion", MeanReversionStrategy(config.get("strategy", {}).get("params", {}))),
-        ]
-    else:
-        strategy_config = config.get("strategy", {})
-        strategy_name = strategy_config.get("name", "momentum")
-        if strategy_name == "momentum":
-            strategy = MomentumStrategy(strategy_config.get("params", {}))
-        elif strategy_name == "mean_reversion":
-            strategy = MeanReversionStrategy(strategy_config.get("params", {}))
+    try:
+        # Risk settings
+        risk_level = config.get("risk_level", 3)
+        risk_config = config.get("risk", {})
+        initial_balance = config.get("paper", {}).get("initial_balance", 10000.0)
+        fee_rate = config.get("paper", {}).get("fee_rate", 0.001)
+        stop_loss = risk_config.get("stop_loss", 0.02)
+        take_profit = risk_config.get("take_profit", 0.04)
+
+        logger.info(f"Risk: SL={stop_loss:.1%} | TP={take_profit:.1%}")
+
+        # Strategies to test
+        if compare:
+            strategies = [
+                ("momentum", MomentumStrategy(config.get("strategy", {}).get("params", {}))),
+                ("mean_reversion", MeanReversionStrategy(config.get("strategy", {}).get("params", {}))),
+            ]
         else:
-            raise ValueError(f"Unknown strategy: {strategy_name}")
-        strategies = [(strategy_name, strategy)]
-        logger.info(f"Strategy: {strategy_name}")
-
-    # Run backtest for each symbol
-    symbols = config.get("symbols", ["BTC/USDT"])
-    timeframe = config.get("timeframe", "1h")
-
-    # Calculate limit based on days and timeframe
-    hours_per_day = 24
-    if timeframe == "1h":
-        limit = days * hours_per_day
-    elif timeframe == "4h":
-        limit = days * (hours_per_day // 4)
-    elif timeframe == "1d":
-        limit = days
-    else:
-        limit = days * hours_per_day
-
-    # Store results for comparison
-    all_results = {name: {} for name, _ in strategies}
-
-    for symbol in symbols:
-        logger.info(f"\nFetching {days} days of {timeframe} data for {symbol}...")
-
-        ohlcv = await exchange.get_ohlcv(symbol, timeframe, limit=limit)
-        df = exchange.ohlcv_to_dataframe(ohlcv)
-
-        for strategy_name, strategy in strategies:
-            if len(df) < strategy.required_history():
-                logger.warning(f"Not enough data for {symbol}")
+            strategy_config = config.get("strategy", {})
+            strategy_name = strategy_config.get("name", "momentum")
+            if strategy_name == "momentum":
+                strategy = MomentumStrategy(strategy_config.get("params", {}))
+            elif strategy_name == "mean_reversion":
+                strategy = MeanReversionStrategy(strategy_config.get("params", {}))
+            else:
+                raise ValueError(f"Unknown strategy: {strategy_name}")
+            strategies = [(strategy_name, strategy)]
+            logger.info(f"Strategy: {strategy_name}")
+
+        # Run backtest for each symbol (once each, even if listed twice)
+        symbols = list(dict.fromkeys(config.get("symbols", ["BTC/USDT"])))
+        timeframe = config.get("timeframe", "1h")
+
+        # Calculate limit based on days and timeframe
+        hours_per_day = 24
+        if timeframe == "1h":
+            limit = days * hours_per_day
+        elif timeframe == "4h":
+            limit = days * (hours_per_day // 4)
+        elif timeframe == "1d":
+            limit = days
+        else:
+            limit = days * hours_per_day
+
+        await exchange.connect()
+
+        # Fetch symbols concurrently; the shared exchange keeps ccxt's
+        # rate limiter coherent and the semaphore bounds in-flight requests
+        fetch_limit = asyncio.Semaphore(config.get("backtest", {}).get("concurrency", 8))
+
+        async def _fetch_and_run(symbol: str) -> dict[str, BacktestResult]:
+            logger.info(f"\nFetching {days} days of {timeframe} data for {symbol}...")
+
+            async with fetch_limit:
+                df = await exchange.get_ohlcv_frame(symbol, timeframe, limit=limit)
+
+            # One frame per symbol, shared by every strategy
+            results = {}
+            for strategy_name, strategy in strategies:
+                if len(df) < strategy.required_history():
+                    logger.warning(f"Not enough data for {symbol}")
+                    continue
+
+                backtest = BacktestEngine(
+                    strategy=strategy,
+                    initial_balance=initial_balance,
+                    position_size_pct=risk_level / 100.0,
+                    fee_rate=fee_rate,
+                    stop_loss_pct=stop_loss,
+                    take_profit_pct=take_profit,
+                )
+
+                if not compare:
+                    logger.info(f"Running backtest on {len(df)} candles...")
+
+                results[strategy_name] = backtest.run(df, symbol)
+
+            return results
+
+        done = await asyncio.gather(
+            *[_fetch_and_run(symbol) for symbol in symbols],
+            return_exceptions=True,
+        )
+
+        report_rows = []  # (symbol, strategy, pnl, win_rate, trades) in symbol order
+        for symbol, results in zip(symbols, done):
+            if isinstance(results, asyncio.CancelledError):
+                raise results
+            if isinstance(results, BaseException):
+                logger.error(f"Backtest failed for {symbol}: {results}")
                 continue
 
-            backtest = BacktestEngine(
-                strategy=strategy,
-                initial_balance=initial_balance,
-                position_size_pct=risk_level / 100.0,
-                fee_rate=fee_rate,
-                stop_loss_pct=stop_loss,
-                take_profit_pct=take_profit,
-            )
+            for strategy_name, result in results.items():
+                report_rows.append((
+                    symbol, strategy_name, result.total_pnl, result.win_rate, result.total_trades
+                ))
 
-            if not compare:
-                logger.info(f"Running backtest on {len(df)} candles...")
+                if not compare:
+                    print("\n" + format_backtest_result(result))
 
-            result = backtest.run(df, symbol)
-            all_results[strategy_name][symbol] = result
+        # Show comparison table if comparing
+        if compare:
+            print("\n" + "=" * 70)
+            print("STRATEGY COMPARISON")
+            print("=" * 70)
+            print(f"{'Symbol':<12} {'Strategy':<16} {'P&L':>10} {'Win Rate':>10} {'Trades':>8}")
+            print("-" * 70)
 
-            if not compare:
-                print("\n" + format_backtest_result(result))
+            report = pd.DataFrame(
+                report_rows, columns=["symbol", "strategy", "pnl", "win_rate", "trades"]
+            )
 
-    # Show comparison table if comparing
-    if compare:
-        print("\n" + "=" * 70)
-        print("STRATEGY COMPARISON")
-        print("=" * 70)
-        print(f"{'Symbol':<12} {'Strategy':<16} {'P&L':>10} {'Win Rate':>10} {'Trades':>8}")
-        print("-" * 70)
-
-        for symbol in symbols:
-            for strategy_name, _ in strategies:
-                if symbol in all_results[strategy_name]:
-                    r = all_results[strategy_name][symbol]
-                    pnl_str = f"${r.total_pnl:+.2f}"
-                    print(f"{symbol:<12} {strategy_name:<16} {pnl_str:>10} {r.win_rate:>9.1f}% {r.total_trades:>8}")
-            print("-" * 70)
+            for _, group in report.groupby("symbol", sort=False):
+                for row in group.itertuples(index=False):
+                    pnl_str = f"${row.pnl:+.2f}"
+                    print(f"{row.symbol:<12} {row.strategy:<16} {pnl_str:>10} {row.win_rate:>9.1f}% {row.trades:>8}")
+                print("-" * 70)
+
+            # Summary (strategies with no results show as zero)
+            summary = (
+                report.groupby("strategy", sort=False)
+                .agg(pnl=("pnl", "sum"), win_rate=("win_rate", "mean"))
+                .reindex([name for name, _ in strategies], fill_value=0.0)
+            )
 
-        # Summary
-        print("\nSUMMARY (Total across all symbols):")
-        for strategy_name, _ in strategies:
-            total_pnl = sum(r.total_pnl for r in all_results[strategy_name].values())
-            avg_win = sum(r.win_rate for r in all_results[strategy_name].values()) / len(all_results[strategy_name]) if all_results[strategy_name] else 0
-            print(f"  {strategy_name}: ${total_pnl:+.2f} | Avg Win Rate: {avg_win:.1f}%")
+            print("\nSUMMARY (Total across all symbols):")
+            for row in summary.itertuples():
+                print(f"  {row.Index}: ${row.pnl:+.2f} | Avg Win Rate: {row.win_rate:.1f}%")
 
-    await exchange.disconnect()
+    finally:
+        await disconnect_all([exchange])
 
 
 def cli() -> None:
@@ -1,6 +1,15 @@
 """Trading strategies."""
 
 from .base import BaseStrategy, Signal
-from .momentum import MomentumStrategy
 
 __all__ = ["BaseStrategy", "Signal", "MomentumStrategy"]
+
+
+def __getattr__(name: str):
+    # Strategy modules pull in the compiled indicator kernels, so they are
+    # imported only when asked for (see TradingEngine.start)
+    if name == "MomentumStrategy":
+        from .momentum import MomentumStrategy
+
+        return MomentumStrategy
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
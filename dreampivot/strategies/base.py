@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 
@@ -19,7 +20,14 @@ class Signal(Enum):
     HOLD = "hold"
 
 
-@dataclass
+# Integer codes for signals in array form (see analyze_series)
+SIGNAL_CODES = {Signal.BUY: 1, Signal.SELL: -1, Signal.HOLD: 0}
+
+# Signal values for logging, without the enum .value lookup
+SIGNAL_STRS = {signal: signal.value for signal in Signal}
+
+
+@dataclass(slots=True)
 class TradeSignal:
     """Complete trade signal with metadata."""
     signal: Signal
@@ -59,6 +67,89 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def precompute(self, df: pd.DataFrame) -> dict[str, Any]:
+        """
+        Compute indicators for the whole DataFrame in one pass.
+
+        Strategies override this to return NumPy arrays aligned to `df`
+        so the backtester can evaluate every candle without re-slicing
+        history. The default keeps the DataFrame for `analyze_at`.
+
+        Args:
+            df: DataFrame with OHLCV data (index=timestamp)
+
+        Returns:
+            Dict of indicator name -> array (or the raw DataFrame)
+        """
+        return {"df": df}
+
+    def analyze_at(self, precomputed: dict[str, Any], i: int, symbol: str) -> TradeSignal:
+        """
+        Generate signal for candle `i` from precomputed indicators.
+
+        Args:
+            precomputed: Output of `precompute`
+            i: Position of the candle being evaluated
+            symbol: Trading pair symbol
+
+        Returns:
+            TradeSignal with buy/sell/hold recommendation
+        """
+        return self.analyze(precomputed["df"].iloc[:i + 1], symbol)
+
+    def analyze_series(
+        self, df: pd.DataFrame, symbol: str = ""
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Generate signals for every candle at once.
+
+        Strategies override this with vectorized indicator logic. The
+        default evaluates `analyze_at` candle by candle.
+
+        Args:
+            df: DataFrame with OHLCV data (index=timestamp)
+            symbol: Trading pair symbol
+
+        Returns:
+            Tuple of (signals as int8 SIGNAL_CODES, confidences as float32,
+            reasons as object array), each aligned to `df`
+        """
+        n = len(df)
+        signals = np.zeros(n, dtype=np.int8)
+        confidences = np.zeros(n, dtype=np.float32)
+        reasons = np.full(n, "Insufficient data", dtype=object)
+
+        precomputed = self.precompute(df)
+        for i in range(self.required_history() - 1, n):
+            trade_signal = self.analyze_at(precomputed, i, symbol)
+            signals[i] = SIGNAL_CODES[trade_signal.signal]
+            confidences[i] = trade_signal.confidence
+            reasons[i] = trade_signal.reason
+
+        return signals, confidences, reasons
+
+    def update_incremental(
+        self, state: dict[str, Any], df: pd.DataFrame, symbol: str
+    ) -> TradeSignal:
+        """
+        Generate signal for the latest candle of a live, growing window.
+
+        Called repeatedly with the same `state` dict for a symbol, so
+        strategies can keep indicator state and only process candles
+        they have not seen. The last row of `df` is the forming candle and
+        may change between calls. The default keeps no state and runs
+        `analyze` on the window.
+
+        Args:
+            state: Per-symbol dict owned by the caller (starts empty)
+            df: Recent OHLCV data (index=timestamp)
+            symbol: Trading pair symbol
+
+        Returns:
+            TradeSignal for the last row of `df`
+        """
+        return self.analyze(df, symbol)
+
     def required_history(self) -> int:
         """Minimum number of candles needed for analysis."""
         return 50
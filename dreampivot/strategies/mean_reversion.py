@@ -9,12 +9,15 @@ Uses Bollinger Bands for entry/exit signals.
 - HOLD: Price is within bands
 """
 
+import math
+from collections import deque
 from typing import Any
 
 import pandas as pd
 import numpy as np
 
-from .base import BaseStrategy, Signal, TradeSignal
+from .base import BaseStrategy, Signal, TradeSignal, SIGNAL_CODES, SIGNAL_STRS
+from ..utils.indicators import mean_std, rsi_last, rsi_series
 from ..utils.logger import get_logger
 
 logger = get_logger("strategy")
@@ -30,18 +33,35 @@ class MeanReversionStrategy(BaseStrategy):
     - HOLD: Price within bands
     """
 
+    # Signal rules in priority order: (signal, confidence, reason).
+    # _decide sets bit k of its condition mask when rule k matches.
+    _RULES = (
+        # Strong: Price below lower band + RSI oversold
+        (Signal.BUY, 0.85, "Price at lower band + RSI oversold"),
+        # Medium: Price near lower band + RSI very oversold
+        (Signal.BUY, 0.75, "Price near lower band + RSI very oversold"),
+        # Weak: Price below lower band (no RSI confirm)
+        (Signal.BUY, 0.60, "Price below lower band"),
+        # Strong: Price above upper band + RSI overbought
+        (Signal.SELL, 0.85, "Price at upper band + RSI overbought"),
+        # Medium: Price near upper band + RSI very overbought
+        (Signal.SELL, 0.75, "Price near upper band + RSI very overbought"),
+        # Weak: Price above upper band (no RSI confirm)
+        (Signal.SELL, 0.60, "Price above upper band"),
+    )
+
     def __init__(self, params: dict[str, Any] | None = None):
         super().__init__(params)
         self._name = "mean_reversion"
 
         # Bollinger Band parameters
-        self.bb_period = self.params.get("bb_period", 20)
-        self.bb_std = self.params.get("bb_std", 2.0)
+        self.bb_period = int(self.params.get("bb_period", 20))
+        self.bb_std = float(self.params.get("bb_std", 2.0))
 
         # RSI for confirmation
-        self.rsi_period = self.params.get("rsi_period", 14)
-        self.rsi_overbought = self.params.get("rsi_overbought", 70)
-        self.rsi_oversold = self.params.get("rsi_oversold", 30)
+        self.rsi_period = int(self.params.get("rsi_period", 14))
+        self.rsi_overbought = float(self.params.get("rsi_overbought", 70))
+        self.rsi_oversold = float(self.params.get("rsi_oversold", 30))
 
     def required_history(self) -> int:
         """Need enough data for Bollinger Bands."""
@@ -57,7 +77,23 @@ class MeanReversionStrategy(BaseStrategy):
                 reason="Insufficient data",
             )
 
-        # Calculate indicators
+        # Only the last candle is needed, so slice the shortest tail that
+        # covers both windows before converting anything
+        tail = max(self.bb_period, self.rsi_period + 1)
+        close = df["close"].to_numpy()[-tail:].astype(np.float64, copy=False)
+        current_sma, current_std = mean_std(close[-self.bb_period:])
+
+        return self._decide(
+            symbol,
+            close[-1],
+            current_sma,
+            current_sma + current_std * self.bb_std,
+            current_sma - current_std * self.bb_std,
+            rsi_last(close, self.rsi_period),
+        )
+
+    def precompute(self, df: pd.DataFrame) -> dict[str, np.ndarray]:
+        """Calculate Bollinger Bands and RSI for every candle."""
         close = df["close"]
 
         # Bollinger Bands
@@ -66,76 +102,210 @@ class MeanReversionStrategy(BaseStrategy):
         upper_band = sma + (std * self.bb_std)
         lower_band = sma - (std * self.bb_std)
 
-        # RSI
-        rsi = self._calculate_rsi(close)
+        # RSI (same kernel and dtype as analyze)
+        prices = close.to_numpy(dtype=np.float64)
+        rsi = rsi_series(prices, self.rsi_period)
+
+        return {
+            "close": prices,
+            "sma": sma.to_numpy(),
+            "upper_band": upper_band.to_numpy(),
+            "lower_band": lower_band.to_numpy(),
+            "rsi": rsi,
+        }
+
+    def analyze_at(self, precomputed: dict[str, np.ndarray], i: int, symbol: str) -> TradeSignal:
+        """Generate trading signal for candle `i` from precomputed indicators."""
+        if i + 1 < self.required_history():
+            return TradeSignal(
+                signal=Signal.HOLD,
+                symbol=symbol,
+                confidence=0.0,
+                reason="Insufficient data",
+            )
+
+        return self._decide(
+            symbol,
+            precomputed["close"][i],
+            precomputed["sma"][i],
+            precomputed["upper_band"][i],
+            precomputed["lower_band"][i],
+            precomputed["rsi"][i],
+        )
+
+    def update_incremental(
+        self, state: dict[str, Any], df: pd.DataFrame, symbol: str
+    ) -> TradeSignal:
+        """
+        Generate signal for the latest candle using streaming indicators.
 
-        # Get latest values
-        current_price = close.iloc[-1]
-        current_sma = sma.iloc[-1]
-        current_upper = upper_band.iloc[-1]
-        current_lower = lower_band.iloc[-1]
-        current_rsi = rsi.iloc[-1]
+        Running sums for the Bollinger and RSI windows are advanced only
+        over closed candles newer than the last one seen, so each tick is
+        O(1); the forming candle is evaluated without committing it.
+        """
+        if len(df) < self.required_history():
+            state.clear()
+            return self.analyze(df, symbol)
+
+        timestamps = df.index
+        closes = df["close"].to_numpy(dtype=np.float64)
+
+        # (Re)seed from the window if state is empty or fell out of it
+        if not state or state["timestamp"] < timestamps[0]:
+            self._seed_state(state, timestamps[:-1], closes[:-1])
+
+        # Commit candles that closed since last call
+        first_new = timestamps.searchsorted(state["timestamp"], side="right")
+        for i in range(first_new, len(df) - 1):
+            self._step_state(state, timestamps[i], closes[i])
+
+        # Evaluate the forming candle without committing it
+        price = closes[-1]
+        n = self.bb_period
+        shift = state["shift"]
+        x = price - shift
+        old = state["window"][0] - shift
+        s1 = state["s1"] + x - old
+        s2 = state["s2"] + x * x - old * old
+
+        mean = s1 / n
+        var = max((s2 - s1 * mean) / (n - 1), 0.0)  # ddof=1, like pandas
+        sma = shift + mean
+        std = math.sqrt(var)
+
+        delta = price - state["close"]
+        avg_gain = self._window_peek(state, "gain", delta if delta > 0 else 0.0)
+        avg_loss = self._window_peek(state, "loss", -delta if delta < 0 else 0.0)
+        rsi = 50.0 if avg_loss == 0 else 100 - (100 / (1 + avg_gain / avg_loss))
+
+        return self._decide(
+            symbol,
+            price,
+            sma,
+            sma + std * self.bb_std,
+            sma - std * self.bb_std,
+            rsi,
+        )
 
+    def _seed_state(self, state: dict[str, Any], timestamps: pd.Index, closes: np.ndarray) -> None:
+        """Initialize streaming indicator state from closed candles."""
+        window = closes[-self.bb_period:]
+
+        # Sums are kept relative to a reference price to limit cancellation
+        shift = float(window.mean())
+        shifted = window - shift
+
+        delta = np.diff(closes[-(self.rsi_period + 1):])
+        gains = np.where(delta > 0, delta, 0.0)
+        losses = np.where(delta < 0, -delta, 0.0)
+
+        state.clear()
+        state.update({
+            "timestamp": timestamps[-1],
+            "close": closes[-1],
+            "window": deque(window, maxlen=self.bb_period),
+            "shift": shift,
+            "s1": float(shifted.sum()),
+            "s2": float((shifted * shifted).sum()),
+            "gain": deque(gains, maxlen=self.rsi_period),
+            "gain_sum": float(gains.sum()),
+            "gain_n": int(np.count_nonzero(gains)),
+            "loss": deque(losses, maxlen=self.rsi_period),
+            "loss_sum": float(losses.sum()),
+            "loss_n": int(np.count_nonzero(losses)),
+        })
+
+    def _step_state(self, state: dict[str, Any], timestamp: Any, price: float) -> None:
+        """Advance streaming indicator state by one closed candle."""
+        shift = state["shift"]
+        x = price - shift
+        old = state["window"][0] - shift
+        state["s1"] += x - old
+        state["s2"] += x * x - old * old
+        state["window"].append(price)
+
+        delta = price - state["close"]
+        self._window_push(state, "gain", delta if delta > 0 else 0.0)
+        self._window_push(state, "loss", -delta if delta < 0 else 0.0)
+
+        state["close"] = price
+        state["timestamp"] = timestamp
+
+    @staticmethod
+    def _window_push(state: dict[str, Any], key: str, value: float) -> None:
+        """Append to a gain/loss window, keeping its running sum and nonzero count."""
+        values = state[key]
+        if len(values) == values.maxlen:
+            dropped = values[0]
+            state[f"{key}_sum"] -= dropped
+            state[f"{key}_n"] -= dropped > 0
+
+        values.append(value)
+        state[f"{key}_sum"] += value
+        state[f"{key}_n"] += value > 0
+
+        # Snap rounding residue once the window holds only zeros
+        if not state[f"{key}_n"]:
+            state[f"{key}_sum"] = 0.0
+
+    @staticmethod
+    def _window_peek(state: dict[str, Any], key: str, value: float) -> float:
+        """Mean of a gain/loss window as if `value` were appended."""
+        values = state[key]
+        total = state[f"{key}_sum"] + value
+        nonzero = state[f"{key}_n"] + (value > 0)
+        count = len(values)
+
+        if count == values.maxlen:
+            total -= values[0]
+            nonzero -= values[0] > 0
+        else:
+            count += 1
+
+        return total / count if nonzero else 0.0
+
+    def _decide(
+        self,
+        symbol: str,
+        current_price: float,
+        current_sma: float,
+        current_upper: float,
+        current_lower: float,
+        current_rsi: float,
+    ) -> TradeSignal:
+        """Turn indicator values for one candle into a signal."""
         # Band width (volatility measure)
         band_width = (current_upper - current_lower) / current_sma * 100
 
         # Position within bands (0 = lower, 1 = upper)
         band_position = (current_price - current_lower) / (current_upper - current_lower)
 
-        # Determine signal
-        signal = Signal.HOLD
-        confidence = 0.0
-        reasons = []
-
         # RSI conditions
         rsi_oversold = current_rsi < self.rsi_oversold
         rsi_overbought = current_rsi > self.rsi_overbought
         rsi_very_oversold = current_rsi < 25
         rsi_very_overbought = current_rsi > 75
 
-        # === BUY SIGNALS ===
-
-        # Strong: Price below lower band + RSI oversold
-        if current_price <= current_lower and rsi_oversold:
-            signal = Signal.BUY
-            confidence = 0.85
-            reasons.append("Price at lower band + RSI oversold")
-
-        # Medium: Price near lower band + RSI very oversold
-        elif band_position < 0.1 and rsi_very_oversold:
-            signal = Signal.BUY
-            confidence = 0.75
-            reasons.append("Price near lower band + RSI very oversold")
-
-        # Weak: Price below lower band (no RSI confirm)
-        elif current_price < current_lower:
-            signal = Signal.BUY
-            confidence = 0.60
-            reasons.append("Price below lower band")
-
-        # === SELL SIGNALS ===
-
-        # Strong: Price above upper band + RSI overbought
-        elif current_price >= current_upper and rsi_overbought:
-            signal = Signal.SELL
-            confidence = 0.85
-            reasons.append("Price at upper band + RSI overbought")
-
-        # Medium: Price near upper band + RSI very overbought
-        elif band_position > 0.9 and rsi_very_overbought:
-            signal = Signal.SELL
-            confidence = 0.75
-            reasons.append("Price near upper band + RSI very overbought")
+        # One bit per rule in _RULES
+        flags = (
+            bool(current_price <= current_lower and rsi_oversold)
+            | bool(band_position < 0.1 and rsi_very_oversold) << 1
+            | bool(current_price < current_lower) << 2
+            | bool(current_price >= current_upper and rsi_overbought) << 3
+            | bool(band_position > 0.9 and rsi_very_overbought) << 4
+            | bool(current_price > current_upper) << 5
+        )
 
-        # Weak: Price above upper band (no RSI confirm)
-        elif current_price > current_upper:
-            signal = Signal.SELL
-            confidence = 0.60
-            reasons.append("Price above upper band")
+        if flags:
+            # Lowest set bit is the highest-priority matching rule
+            signal, confidence, reason = self._RULES[(flags & -flags).bit_length() - 1]
+            reasons = [reason]
 
         # === HOLD ===
         else:
-            reasons.append("Price within bands")
+            signal = Signal.HOLD
+            confidence = 0.0
+            reasons = ["Price within bands"]
             if band_position > 0.7:
                 reasons.append("Near upper band (watching)")
             elif band_position < 0.3:
@@ -146,9 +316,10 @@ class MeanReversionStrategy(BaseStrategy):
 
         reason_text = " | ".join(reasons)
 
+        # Formatted by loguru only if DEBUG is enabled
         logger.debug(
-            f"{symbol}: Price={current_price:.2f}, SMA={current_sma:.2f}, "
-            f"RSI={current_rsi:.1f} -> {signal.value} ({confidence:.0%})"
+            "{}: Price={:.2f}, SMA={:.2f}, RSI={:.1f} -> {} ({:.0%})",
+            symbol, current_price, current_sma, current_rsi, SIGNAL_STRS[signal], confidence,
         )
 
         return TradeSignal(
@@ -156,29 +327,79 @@ class MeanReversionStrategy(BaseStrategy):
             symbol=symbol,
             confidence=confidence,
             reason=reason_text,
-            metadata={
-                "sma": current_sma,
-                "upper_band": current_upper,
-                "lower_band": current_lower,
-                "band_width": band_width,
-                "band_position": band_position,
-                "rsi": current_rsi,
+            metadata={  # Plain floats, not NumPy scalars
+                "sma": float(current_sma),
+                "upper_band": float(current_upper),
+                "lower_band": float(current_lower),
+                "band_width": float(band_width),
+                "band_position": float(band_position),
+                "rsi": float(current_rsi),
             },
         )
 
-    def _calculate_rsi(self, prices: pd.Series) -> pd.Series:
-        """Calculate RSI indicator."""
-        delta = prices.diff()
+    def analyze_series(
+        self, df: pd.DataFrame, symbol: str = ""
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Generate signals for every candle with vectorized conditions."""
+        ind = self.precompute(df)
+        price = ind["close"]
+        upper = ind["upper_band"]
+        lower = ind["lower_band"]
+        rsi = ind["rsi"]
 
-        gain = delta.where(delta > 0, 0.0)
-        loss = (-delta).where(delta < 0, 0.0)
-
-        avg_gain = gain.rolling(window=self.rsi_period, min_periods=1).mean()
-        avg_loss = loss.rolling(window=self.rsi_period, min_periods=1).mean()
-
-        # Avoid division by zero
-        avg_loss = avg_loss.replace(0, np.nan)
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
+        # Position within bands (0 = lower, 1 = upper)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            band_position = (price - lower) / (upper - lower)
 
-        return rsi.fillna(50)
+        # RSI conditions
+        rsi_oversold = rsi < self.rsi_oversold
+        rsi_overbought = rsi > self.rsi_overbought
+        rsi_very_oversold = rsi < 25
+        rsi_very_overbought = rsi > 75
+
+        # Same priority order as analyze_at
+        conditions = [
+            (price <= lower) & rsi_oversold,
+            (band_position < 0.1) & rsi_very_oversold,
+            price < lower,
+            (price >= upper) & rsi_overbought,
+            (band_position > 0.9) & rsi_very_overbought,
+            price > upper,
+        ]
+        buy = SIGNAL_CODES[Signal.BUY]
+        sell = SIGNAL_CODES[Signal.SELL]
+
+        signals = np.select(conditions, [buy, buy, buy, sell, sell, sell], SIGNAL_CODES[Signal.HOLD])
+        confidences = np.select(conditions, [0.85, 0.75, 0.60, 0.85, 0.75, 0.60], 0.0)
+        hold_reasons = np.where(
+            band_position > 0.7,
+            "Price within bands | Near upper band (watching)",
+            np.where(
+                band_position < 0.3,
+                "Price within bands | Near lower band (watching)",
+                "Price within bands",
+            ),
+        )
+        reasons = np.select(
+            conditions,
+            [
+                "Price at lower band + RSI oversold",
+                "Price near lower band + RSI very oversold",
+                "Price below lower band",
+                "Price at upper band + RSI overbought",
+                "Price near upper band + RSI very overbought",
+                "Price above upper band",
+            ],
+            hold_reasons,
+        ).astype(object)
+
+        signals = signals.astype(np.int8)
+        confidences = confidences.astype(np.float32)
+
+        # Not enough history yet
+        warmup = self.required_history() - 1
+        signals[:warmup] = SIGNAL_CODES[Signal.HOLD]
+        confidences[:warmup] = 0.0
+        reasons[:warmup] = "Insufficient data"
+
+        return signals, confidences, reasons
@@ -8,12 +8,14 @@ Enhanced momentum-based trading:
 - Multiple signal conditions for more opportunities
 """
 
+from collections import deque
 from typing import Any
 
 import pandas as pd
 import numpy as np
 
-from .base import BaseStrategy, Signal, TradeSignal
+from .base import BaseStrategy, Signal, TradeSignal, SIGNAL_CODES, SIGNAL_STRS
+from ..utils.indicators import ewm, ewm_into, ewm_last2, rsi_last, rsi_series
 from ..utils.logger import get_logger
 
 logger = get_logger("strategy")
@@ -29,22 +31,49 @@ class MomentumStrategy(BaseStrategy):
     - HOLD: Unclear signals or neutral market
     """
 
+    # Signal rules in priority order:
+    # (signal, confidence, reason, confidence with RSI confirmation, RSI reason).
+    # _decide sets bit k of its condition mask when rule k matches.
+    _RULES = (
+        # Strong: MACD crossover in uptrend
+        (Signal.BUY, 0.85, "MACD bullish crossover + uptrend", 0.90, "RSI oversold"),
+        # Medium: MACD crossover (no trend requirement)
+        (Signal.BUY, 0.70, "MACD bullish crossover", 0.70 + 0.10, "RSI oversold"),
+        # Weak: RSI very oversold in uptrend
+        (Signal.BUY, 0.65, "RSI very oversold + uptrend", None, None),
+        # Strong: MACD crossover in downtrend
+        (Signal.SELL, 0.85, "MACD bearish crossover + downtrend", 0.90, "RSI overbought"),
+        # Medium: MACD crossover (no trend requirement)
+        (Signal.SELL, 0.70, "MACD bearish crossover", 0.70 + 0.10, "RSI overbought"),
+        # Weak: RSI very overbought in downtrend
+        (Signal.SELL, 0.65, "RSI very overbought + downtrend", None, None),
+    )
+
     def __init__(self, params: dict[str, Any] | None = None):
         super().__init__(params)
         self._name = "momentum"
 
         # MACD parameters
-        self.fast_period = self.params.get("fast_period", 12)
-        self.slow_period = self.params.get("slow_period", 26)
-        self.signal_period = self.params.get("signal_period", 9)
+        self.fast_period = int(self.params.get("fast_period", 12))
+        self.slow_period = int(self.params.get("slow_period", 26))
+        self.signal_period = int(self.params.get("signal_period", 9))
 
         # RSI parameters
-        self.rsi_period = self.params.get("rsi_period", 14)
-        self.rsi_overbought = self.params.get("rsi_overbought", 70)
-        self.rsi_oversold = self.params.get("rsi_oversold", 30)
+        self.rsi_period = int(self.params.get("rsi_period", 14))
+        self.rsi_overbought = float(self.params.get("rsi_overbought", 70))
+        self.rsi_oversold = float(self.params.get("rsi_oversold", 30))
 
         # Trend filter (EMA)
-        self.trend_period = self.params.get("trend_period", 50)
+        self.trend_period = int(self.params.get("trend_period", 50))
+
+        # EMA smoothing factors (span -> alpha)
+        self._alpha_fast = 2.0 / (self.fast_period + 1)
+        self._alpha_slow = 2.0 / (self.slow_period + 1)
+        self._alpha_signal = 2.0 / (self.signal_period + 1)
+        self._alpha_trend = 2.0 / (self.trend_period + 1)
+
+        # Scratch rows (fast EMA, slow EMA, MACD) reused by analyze
+        self._ema_buf = np.empty((3, self.required_history()), dtype=np.float64)
 
     def required_history(self) -> int:
         """Need enough data for trend EMA."""
@@ -60,36 +89,194 @@ class MomentumStrategy(BaseStrategy):
                 reason="Insufficient data",
             )
 
-        # Calculate indicators
+        # EMAs need the whole history; RSI only needs the tail
+        prices = df["close"].to_numpy(dtype=np.float64)
+        fast_ema, slow_ema, macd_line = self._ema_buffers(len(prices))
+
+        ewm_into(prices, self._alpha_fast, fast_ema)
+        ewm_into(prices, self._alpha_slow, slow_ema)
+        np.subtract(fast_ema, slow_ema, out=macd_line)
+
+        # Crossovers only need the last two histogram values
+        prev_signal, current_signal = ewm_last2(macd_line, self._alpha_signal)
+        _, current_trend_ema = ewm_last2(prices, self._alpha_trend)
+
+        return self._decide(
+            symbol,
+            current_macd=macd_line[-1],
+            current_signal=current_signal,
+            current_histogram=macd_line[-1] - current_signal,
+            prev_histogram=macd_line[-2] - prev_signal,
+            current_rsi=rsi_last(prices, self.rsi_period),
+            current_price=prices[-1],
+            current_trend_ema=current_trend_ema,
+        )
+
+    def _ema_buffers(self, n: int) -> np.ndarray:
+        """EMA scratch rows of length n (reallocated only when n changes)."""
+        if self._ema_buf.shape[1] != n:
+            self._ema_buf = np.empty((3, n), dtype=np.float64)
+        return self._ema_buf
+
+    def precompute(self, df: pd.DataFrame) -> dict[str, np.ndarray]:
+        """Calculate MACD, RSI and trend EMA for every candle."""
         close = df["close"]
+        prices = close.to_numpy(dtype=np.float64)
 
         # MACD
-        macd_line, signal_line, histogram = self._calculate_macd(close)
+        macd_line, signal_line, histogram = self._calculate_macd(prices)
 
-        # RSI
-        rsi = self._calculate_rsi(close)
+        # RSI (same kernel and dtype as analyze)
+        rsi = rsi_series(prices, self.rsi_period)
 
         # Trend EMA
-        trend_ema = close.ewm(span=self.trend_period, adjust=False).mean()
+        trend_ema = ewm(prices, self._alpha_trend)
+
+        return {
+            "close": prices,
+            "macd": macd_line,
+            "macd_signal": signal_line,
+            "macd_histogram": histogram,
+            "rsi": rsi,
+            "trend_ema": trend_ema,
+        }
+
+    def analyze_at(self, precomputed: dict[str, np.ndarray], i: int, symbol: str) -> TradeSignal:
+        """Generate trading signal for candle `i` from precomputed indicators."""
+        if i + 1 < self.required_history():
+            return TradeSignal(
+                signal=Signal.HOLD,
+                symbol=symbol,
+                confidence=0.0,
+                reason="Insufficient data",
+            )
+
+        # Get values at candle i
+        histogram = precomputed["macd_histogram"]
+        return self._decide(
+            symbol,
+            current_macd=precomputed["macd"][i],
+            current_signal=precomputed["macd_signal"][i],
+            current_histogram=histogram[i],
+            prev_histogram=histogram[i - 1],
+            current_rsi=precomputed["rsi"][i],
+            current_price=precomputed["close"][i],
+            current_trend_ema=precomputed["trend_ema"][i],
+        )
 
-        # Get latest values
-        current_macd = macd_line.iloc[-1]
-        current_signal = signal_line.iloc[-1]
-        current_histogram = histogram.iloc[-1]
-        prev_histogram = histogram.iloc[-2]
-        current_rsi = rsi.iloc[-1]
-        current_price = close.iloc[-1]
-        current_trend_ema = trend_ema.iloc[-1]
+    def update_incremental(
+        self, state: dict[str, Any], df: pd.DataFrame, symbol: str
+    ) -> TradeSignal:
+        """
+        Generate signal for the latest candle using streaming indicators.
 
+        EMAs and RSI windows are advanced only over closed candles newer
+        than the last one seen; the forming candle is applied on a copy.
+        """
+        if len(df) < self.required_history():
+            state.clear()
+            return self.analyze(df, symbol)
+
+        timestamps = df.index
+        closes = df["close"].to_numpy(dtype=np.float64)
+
+        # (Re)seed from the window if state is empty or fell out of it
+        if not state or state["timestamp"] < timestamps[0]:
+            self._seed_state(state, timestamps[:-1], closes[:-1])
+
+        # Commit candles that closed since last call
+        first_new = timestamps.searchsorted(state["timestamp"], side="right")
+        for i in range(first_new, len(df) - 1):
+            self._step_state(state, timestamps[i], closes[i])
+
+        # Evaluate the forming candle without committing it
+        current = dict(state)
+        current["gains"] = state["gains"].copy()
+        current["losses"] = state["losses"].copy()
+        self._step_state(current, timestamps[-1], closes[-1])
+
+        return self._decide(
+            symbol,
+            current_macd=current["macd"],
+            current_signal=current["macd_signal"],
+            current_histogram=current["macd_histogram"],
+            prev_histogram=state["macd_histogram"],
+            current_rsi=self._rsi_from_state(current),
+            current_price=closes[-1],
+            current_trend_ema=current["trend_ema"],
+        )
+
+    def _seed_state(self, state: dict[str, Any], timestamps: pd.Index, closes: np.ndarray) -> None:
+        """Initialize streaming indicator state from closed candles."""
+        fast_ema = ewm(closes, self._alpha_fast)
+        slow_ema = ewm(closes, self._alpha_slow)
+        macd_line = fast_ema - slow_ema
+        signal_line = ewm(macd_line, self._alpha_signal)
+        trend_ema = ewm(closes, self._alpha_trend)
+
+        delta = np.diff(closes[-(self.rsi_period + 1):])
+
+        state.clear()
+        state.update({
+            "timestamp": timestamps[-1],
+            "close": closes[-1],
+            "fast_ema": fast_ema[-1],
+            "slow_ema": slow_ema[-1],
+            "macd": macd_line[-1],
+            "macd_signal": signal_line[-1],
+            "macd_histogram": macd_line[-1] - signal_line[-1],
+            "trend_ema": trend_ema[-1],
+            "gains": deque(np.where(delta > 0, delta, 0.0), maxlen=self.rsi_period),
+            "losses": deque(np.where(delta < 0, -delta, 0.0), maxlen=self.rsi_period),
+        })
+
+    def _step_state(self, state: dict[str, Any], timestamp: Any, price: float) -> None:
+        """Advance streaming indicator state by one candle."""
+        fast_alpha = self._alpha_fast
+        slow_alpha = self._alpha_slow
+        signal_alpha = self._alpha_signal
+        trend_alpha = self._alpha_trend
+
+        state["fast_ema"] = fast_alpha * price + (1 - fast_alpha) * state["fast_ema"]
+        state["slow_ema"] = slow_alpha * price + (1 - slow_alpha) * state["slow_ema"]
+        state["macd"] = state["fast_ema"] - state["slow_ema"]
+        state["macd_signal"] = signal_alpha * state["macd"] + (1 - signal_alpha) * state["macd_signal"]
+        state["macd_histogram"] = state["macd"] - state["macd_signal"]
+        state["trend_ema"] = trend_alpha * price + (1 - trend_alpha) * state["trend_ema"]
+
+        delta = price - state["close"]
+        state["gains"].append(delta if delta > 0 else 0.0)
+        state["losses"].append(-delta if delta < 0 else 0.0)
+
+        state["close"] = price
+        state["timestamp"] = timestamp
+
+    def _rsi_from_state(self, state: dict[str, Any]) -> float:
+        """RSI from the streaming gain/loss windows."""
+        avg_gain = sum(state["gains"]) / len(state["gains"])
+        avg_loss = sum(state["losses"]) / len(state["losses"])
+
+        # Same neutral default as rsi_last when there are no losses
+        if avg_loss == 0:
+            return 50.0
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+    def _decide(
+        self,
+        symbol: str,
+        current_macd: float,
+        current_signal: float,
+        current_histogram: float,
+        prev_histogram: float,
+        current_rsi: float,
+        current_price: float,
+        current_trend_ema: float,
+    ) -> TradeSignal:
+        """Turn indicator values for one candle into a signal."""
         # Trend direction
         uptrend = current_price > current_trend_ema
         downtrend = current_price < current_trend_ema
 
-        # Determine signal
-        signal = Signal.HOLD
-        confidence = 0.0
-        reasons = []
-
         # MACD crossover detection
         macd_bullish_cross = current_histogram > 0 and prev_histogram <= 0
         macd_bearish_cross = current_histogram < 0 and prev_histogram >= 0
@@ -97,7 +284,6 @@ class MomentumStrategy(BaseStrategy):
         # MACD trend conditions
         macd_bullish = current_histogram > 0
         macd_bearish = current_histogram < 0
-        macd_strengthening = abs(current_histogram) > abs(prev_histogram)
 
         # RSI conditions
         rsi_oversold = current_rsi < self.rsi_oversold
@@ -105,61 +291,34 @@ class MomentumStrategy(BaseStrategy):
         rsi_very_oversold = current_rsi < 25
         rsi_very_overbought = current_rsi > 75
 
-        # === BUY SIGNALS (only in uptrend or neutral) ===
-
-        # Strong: MACD crossover in uptrend
-        if macd_bullish_cross and uptrend and not rsi_overbought:
-            signal = Signal.BUY
-            confidence = 0.85
-            reasons.append("MACD bullish crossover + uptrend")
-            if rsi_oversold:
-                confidence = 0.90
-                reasons.append("RSI oversold")
-
-        # Medium: MACD crossover (no trend requirement)
-        elif macd_bullish_cross and not rsi_overbought:
-            signal = Signal.BUY
-            confidence = 0.70
-            reasons.append("MACD bullish crossover")
-            if rsi_oversold:
-                confidence += 0.10
-                reasons.append("RSI oversold")
-
-        # Weak: RSI very oversold in uptrend
-        elif rsi_very_oversold and uptrend and macd_bullish:
-            signal = Signal.BUY
-            confidence = 0.65
-            reasons.append("RSI very oversold + uptrend")
-
-        # === SELL SIGNALS (only in downtrend or neutral) ===
-
-        # Strong: MACD crossover in downtrend
-        elif macd_bearish_cross and downtrend and not rsi_oversold:
-            signal = Signal.SELL
-            confidence = 0.85
-            reasons.append("MACD bearish crossover + downtrend")
-            if rsi_overbought:
-                confidence = 0.90
-                reasons.append("RSI overbought")
+        # One bit per rule in _RULES (buys only in uptrend or neutral,
+        # sells only in downtrend or neutral)
+        flags = (
+            bool(macd_bullish_cross and uptrend and not rsi_overbought)
+            | bool(macd_bullish_cross and not rsi_overbought) << 1
+            | bool(rsi_very_oversold and uptrend and macd_bullish) << 2
+            | bool(macd_bearish_cross and downtrend and not rsi_oversold) << 3
+            | bool(macd_bearish_cross and not rsi_oversold) << 4
+            | bool(rsi_very_overbought and downtrend and macd_bearish) << 5
+        )
 
-        # Medium: MACD crossover (no trend requirement)
-        elif macd_bearish_cross and not rsi_oversold:
-            signal = Signal.SELL
-            confidence = 0.70
-            reasons.append("MACD bearish crossover")
-            if rsi_overbought:
-                confidence += 0.10
-                reasons.append("RSI overbought")
+        if flags:
+            # Lowest set bit is the highest-priority matching rule
+            signal, confidence, reason, confirmed_confidence, confirmation = (
+                self._RULES[(flags & -flags).bit_length() - 1]
+            )
+            reasons = [reason]
 
-        # Weak: RSI very overbought in downtrend
-        elif rsi_very_overbought and downtrend and macd_bearish:
-            signal = Signal.SELL
-            confidence = 0.65
-            reasons.append("RSI very overbought + downtrend")
+            rsi_confirms = rsi_oversold if signal == Signal.BUY else rsi_overbought
+            if confirmation and rsi_confirms:
+                confidence = confirmed_confidence
+                reasons.append(confirmation)
 
         # === HOLD ===
         else:
-            reasons.append("No clear signal")
+            signal = Signal.HOLD
+            confidence = 0.0
+            reasons = ["No clear signal"]
             if uptrend:
                 reasons.append("Uptrend (waiting for entry)")
             elif downtrend:
@@ -172,9 +331,10 @@ class MomentumStrategy(BaseStrategy):
 
         reason_text = " | ".join(reasons)
 
+        # Formatted by loguru only if DEBUG is enabled
         logger.debug(
-            f"{symbol}: MACD={current_macd:.4f}, Signal={current_signal:.4f}, "
-            f"RSI={current_rsi:.1f} -> {signal.value} ({confidence:.0%})"
+            "{}: MACD={:.4f}, Signal={:.4f}, RSI={:.1f} -> {} ({:.0%})",
+            symbol, current_macd, current_signal, current_rsi, SIGNAL_STRS[signal], confidence,
         )
 
         return TradeSignal(
@@ -182,42 +342,108 @@ class MomentumStrategy(BaseStrategy):
             symbol=symbol,
             confidence=confidence,
             reason=reason_text,
-            metadata={
-                "macd": current_macd,
-                "macd_signal": current_signal,
-                "macd_histogram": current_histogram,
-                "rsi": current_rsi,
-                "trend_ema": current_trend_ema,
+            metadata={  # Plain floats, not NumPy scalars
+                "macd": float(current_macd),
+                "macd_signal": float(current_signal),
+                "macd_histogram": float(current_histogram),
+                "rsi": float(current_rsi),
+                "trend_ema": float(current_trend_ema),
                 "trend": "up" if uptrend else ("down" if downtrend else "neutral"),
             },
         )
 
-    def _calculate_macd(
-        self, prices: pd.Series
-    ) -> tuple[pd.Series, pd.Series, pd.Series]:
-        """Calculate MACD indicator."""
-        fast_ema = prices.ewm(span=self.fast_period, adjust=False).mean()
-        slow_ema = prices.ewm(span=self.slow_period, adjust=False).mean()
+    def analyze_series(
+        self, df: pd.DataFrame, symbol: str = ""
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Generate signals for every candle with vectorized conditions."""
+        ind = self.precompute(df)
+        histogram = ind["macd_histogram"]
+        prev_histogram = np.concatenate(([np.nan], histogram[:-1]))
+        rsi = ind["rsi"]
 
-        macd_line = fast_ema - slow_ema
-        signal_line = macd_line.ewm(span=self.signal_period, adjust=False).mean()
-        histogram = macd_line - signal_line
-
-        return macd_line, signal_line, histogram
+        # Trend direction
+        uptrend = ind["close"] > ind["trend_ema"]
+        downtrend = ind["close"] < ind["trend_ema"]
 
-    def _calculate_rsi(self, prices: pd.Series) -> pd.Series:
-        """Calculate RSI indicator."""
-        delta = prices.diff()
+        # MACD conditions
+        macd_bullish_cross = (histogram > 0) & (prev_histogram <= 0)
+        macd_bearish_cross = (histogram < 0) & (prev_histogram >= 0)
+        macd_bullish = histogram > 0
+        macd_bearish = histogram < 0
 
-        gain = delta.where(delta > 0, 0.0)
-        loss = (-delta).where(delta < 0, 0.0)
+        # RSI conditions
+        rsi_oversold = rsi < self.rsi_oversold
+        rsi_overbought = rsi > self.rsi_overbought
+        rsi_very_oversold = rsi < 25
+        rsi_very_overbought = rsi > 75
+
+        # Same priority order as analyze_at
+        conditions = [
+            macd_bullish_cross & uptrend & ~rsi_overbought,
+            macd_bullish_cross & ~rsi_overbought,
+            rsi_very_oversold & uptrend & macd_bullish,
+            macd_bearish_cross & downtrend & ~rsi_oversold,
+            macd_bearish_cross & ~rsi_oversold,
+            rsi_very_overbought & downtrend & macd_bearish,
+        ]
+        buy = SIGNAL_CODES[Signal.BUY]
+        sell = SIGNAL_CODES[Signal.SELL]
+
+        signals = np.select(conditions, [buy, buy, buy, sell, sell, sell], SIGNAL_CODES[Signal.HOLD])
+        confidences = np.select(
+            conditions,
+            [
+                np.where(rsi_oversold, 0.90, 0.85),
+                np.where(rsi_oversold, 0.70 + 0.10, 0.70),
+                0.65,
+                np.where(rsi_overbought, 0.90, 0.85),
+                np.where(rsi_overbought, 0.70 + 0.10, 0.70),
+                0.65,
+            ],
+            0.0,
+        )
+        hold_reasons = np.where(
+            uptrend,
+            "No clear signal | Uptrend (waiting for entry)",
+            np.where(
+                downtrend,
+                "No clear signal | Downtrend (waiting for exit)",
+                "No clear signal | Trend neutral",
+            ),
+        )
+        reasons = np.select(
+            conditions,
+            [
+                np.where(rsi_oversold, "MACD bullish crossover + uptrend | RSI oversold", "MACD bullish crossover + uptrend"),
+                np.where(rsi_oversold, "MACD bullish crossover | RSI oversold", "MACD bullish crossover"),
+                "RSI very oversold + uptrend",
+                np.where(rsi_overbought, "MACD bearish crossover + downtrend | RSI overbought", "MACD bearish crossover + downtrend"),
+                np.where(rsi_overbought, "MACD bearish crossover | RSI overbought", "MACD bearish crossover"),
+                "RSI very overbought + downtrend",
+            ],
+            hold_reasons,
+        ).astype(object)
+
+        signals = signals.astype(np.int8)
+        confidences = np.minimum(confidences, 1.0).astype(np.float32)
+
+        # Not enough history yet
+        warmup = self.required_history() - 1
+        signals[:warmup] = SIGNAL_CODES[Signal.HOLD]
+        confidences[:warmup] = 0.0
+        reasons[:warmup] = "Insufficient data"
+
+        return signals, confidences, reasons
 
-        avg_gain = gain.rolling(window=self.rsi_period, min_periods=1).mean()
-        avg_loss = loss.rolling(window=self.rsi_period, min_periods=1).mean()
+    def _calculate_macd(
+        self, prices: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Calculate MACD indicator (float64 close prices)."""
+        fast_ema = ewm(prices, self._alpha_fast)
+        slow_ema = ewm(prices, self._alpha_slow)
 
-        # Avoid division by zero
-        avg_loss = avg_loss.replace(0, np.nan)
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
+        macd_line = fast_ema - slow_ema
+        signal_line = ewm(macd_line, self._alpha_signal)
+        histogram = macd_line - signal_line
 
-        return rsi.fillna(50)  # Default to neutral
+        return macd_line, signal_line, histogram
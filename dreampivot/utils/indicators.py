@@ -0,0 +1,146 @@
+"""
+Indicator Kernels
+
+Compiled helpers for strategies that only need the latest
+indicator value, avoiding full-length pandas Series.
+"""
+
+import math
+import os
+
+import numpy as np
+
+from .jit import njit
+
+
+@njit(cache=True)
+def ewm_into(x, alpha, out):
+    """
+    Exponential moving average written into `out` (same length as x).
+
+    Same as pandas ewm(adjust=False), seeded with the first value:
+    s[0] = x[0], s[t] = a*x[t] + (1-a)*s[t-1].
+    """
+    if x.size == 0:
+        return out
+
+    s = x[0]
+    out[0] = s
+    for i in range(1, x.size):
+        s = alpha * x[i] + (1.0 - alpha) * s
+        out[i] = s
+    return out
+
+
+@njit(cache=True)
+def ewm(x, alpha):
+    """Exponential moving average into a new array (see ewm_into)."""
+    return ewm_into(x, alpha, np.empty_like(x))
+
+
+@njit(cache=True)
+def ewm_last2(x, alpha):
+    """
+    Last two values of ewm(x, alpha) without storing the series.
+
+    Enough for crossover checks; x must not be empty.
+    """
+    prev = x[0]
+    s = x[0]
+    for i in range(1, x.size):
+        prev = s
+        s = alpha * x[i] + (1.0 - alpha) * s
+    return prev, s
+
+
+@njit(cache=True)
+def mean_std(x):
+    """
+    Mean and sample std (ddof=1, like pandas rolling std) in one pass.
+
+    Welford's update, so the window is read once and large prices do
+    not cancel out. Std is NaN with fewer than two values.
+    """
+    n = x.size
+    m = 0.0
+    m2 = 0.0
+    for i in range(n):
+        d = x[i] - m
+        m += d / (i + 1)
+        m2 += d * (x[i] - m)
+    if n < 2:
+        return m, np.nan
+    return m, math.sqrt(m2 / (n - 1))
+
+
+@njit(cache=True)
+def rsi_last(close, period):
+    """
+    RSI of the last candle only.
+
+    Same definition the strategies use for full series: simple mean of
+    gains and losses over the last `period` changes, 50 when there are no
+    losses. With fewer than `period` changes the leading (undefined)
+    change counts as zero, as in pandas rolling(min_periods=1).
+
+    Args:
+        close: Close prices (float64)
+        period: RSI lookback
+    """
+    n = close.size
+    if n == 0:
+        return 50.0
+
+    start = max(n - period - 1, 0)
+    gain = 0.0
+    loss = 0.0
+    for i in range(start + 1, n):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gain += delta
+        elif delta < 0:
+            loss -= delta
+
+    count = period if n > period else n
+    avg_gain = gain / count
+    avg_loss = loss / count
+    if avg_loss == 0:
+        return 50.0
+
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+
+@njit(cache=True)
+def rsi_series(close, period):
+    """
+    RSI for every candle, each value exactly what rsi_last returns for
+    the closes up to that candle (so backtests and live ticks agree).
+    """
+    out = np.empty(close.size, dtype=np.float64)
+    for i in range(close.size):
+        out[i] = rsi_last(close[:i + 1], period)
+    return out
+
+
+def warmup() -> None:
+    """
+    Compile the kernels now rather than on the first strategy tick.
+
+    With numba's on-disk cache this is a quick load after the first run.
+    """
+    x = np.arange(64, dtype=np.float64)
+    ewm(x, 0.5)
+    ewm_into(x, 0.5, np.empty_like(x))
+    ewm_last2(x, 0.5)
+    mean_std(x)
+    rsi_last(x, 14)
+    rsi_series(x, 14)
+
+
+# Opt-in warmup at import (e.g. for the live engine)
+if os.getenv("DREAMPIVOT_WARMUP") == "1":
+    warmup()
+
+
+__all__ = ["ewm", "ewm_into", "ewm_last2", "mean_std", "rsi_last", "rsi_series", "warmup"]
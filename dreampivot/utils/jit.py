@@ -0,0 +1,21 @@
+"""
+JIT Compilation
+
+Uses numba to compile hot numeric loops when it is installed.
+Without numba, decorated functions run as plain Python.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+__all__ = ["njit"]
@@ -0,0 +1,59 @@
+"""
+OHLCV Cache
+
+File-backed cache for raw candle rows, so repeated backtests
+don't re-download the same immutable history.
+
+Rows are stored exactly as ccxt returns them:
+[timestamp_ms, open, high, low, close, volume]
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from .logger import get_logger
+
+logger = get_logger("ohlcv_cache")
+
+CACHE_DIR = Path(".cache") / "ohlcv"
+
+
+def cache_key(exchange: str, symbol: str, timeframe: str, limit: int) -> str:
+    """Build a cache key for a candle request."""
+    raw = f"{exchange}|{symbol}|{timeframe}|{limit}"
+    return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+
+def load(key: str) -> tuple[list[list[Any]], float] | None:
+    """
+    Load cached rows.
+
+    Returns:
+        (rows, fetched_at unix seconds), or None if not cached
+    """
+    file_path = CACHE_DIR / f"{key}.json"
+    if not file_path.exists():
+        return None
+
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data["rows"], data["fetched_at"]
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Ignoring unreadable OHLCV cache {file_path}: {e}")
+        return None
+
+
+def store(key: str, rows: list[list[Any]], fetched_at: float) -> None:
+    """Save rows to the cache."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    file_path = CACHE_DIR / f"{key}.json"
+
+    # Write then rename so readers never see a partial file
+    tmp_path = file_path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"fetched_at": fetched_at, "rows": rows}, f)
+    os.replace(tmp_path, file_path)
@@ -0,0 +1,46 @@
+"""
+Rate Limiting
+
+Async limiter that spaces out requests to an exchange.
+One instance is shared by every client of the same exchange,
+so concurrent callers can't burst past the exchange's limit.
+"""
+
+import asyncio
+import time
+
+
+class RateLimiter:
+    """
+    Minimum-interval limiter for async code.
+
+    Usage:
+        async with limiter:
+            await exchange.fetch_ticker(symbol)
+    """
+
+    def __init__(self, interval: float = 0.0):
+        """
+        Args:
+            interval: Minimum seconds between requests
+        """
+        self.interval = interval
+        self._next_slot = 0.0
+
+    def slow_to(self, interval: float) -> None:
+        """Raise the interval if `interval` is stricter (never lowers it)."""
+        self.interval = max(self.interval, interval)
+
+    async def __aenter__(self) -> "RateLimiter":
+        # Reserve the next slot before awaiting, so concurrent
+        # callers queue up one interval apart
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
@@ -5,15 +5,75 @@ Logs all signals and trades for analysis.
 Tracks portfolio value over time.
 """
 
+import atexit
 import json
+import math
+import os
+import time
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+import numpy as np
 
 from .logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
 logger = get_logger("tracker")
 
+# Live trackers, flushed at exit (weak, so closed trackers can be freed)
+_TRACKERS: "weakref.WeakSet[PerformanceTracker]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all() -> None:
+    """Write buffered records of every live tracker to disk."""
+    for tracker in list(_TRACKERS):
+        tracker.flush()
+
+
+def _finite(value: Any) -> Any:
+    """Replace NaN/inf floats with None, recursing into dicts and lists."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(v) for v in value]
+    return value
+
+
+def _dumps(record: dict) -> bytes:
+    """
+    Serialize a record to JSON bytes (orjson when available).
+
+    NaN and inf are written as null either way, so the file format does
+    not depend on whether orjson is installed.
+    """
+    if orjson is not None:
+        # Indicator metadata carries NumPy scalars
+        return orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY)
+    try:
+        return json.dumps(record, allow_nan=False).encode("utf-8")
+    except ValueError:
+        # Only records with non-finite values take the slow path
+        return json.dumps(_finite(record)).encode("utf-8")
+
+
+def _loads(line: bytes) -> Any:
+    """Parse one JSON line (orjson when available)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # Bare NaN/Infinity tokens, as written by the json module
+    return json.loads(line)
+
 
 class PerformanceTracker:
     """
@@ -34,24 +94,45 @@ class PerformanceTracker:
         self.trades_file = self.data_dir / "trades.jsonl"
         self.portfolio_file = self.data_dir / "portfolio.jsonl"
 
+        # Append handles, opened on first write and kept open
+        self._handles: dict[Path, BinaryIO] = {}
+
+        # Signals fire every tick, so they are batched before writing
+        self._signal_buf: list[bytes] = []
+        self._buf_cap = int(os.getenv("DREAMPIVOT_LOG_BUF", "128"))
+        # ...and written to disk at least this often (seconds)
+        self._flush_interval = float(os.getenv("DREAMPIVOT_LOG_FLUSH_S", "30"))
+        self._last_flush = time.monotonic()
+        _TRACKERS.add(self)
+
+        # Last timestamp string, reused within the same millisecond
+        self._now_ms = -1
+        self._now_str = ""
+
         # In-memory stats
         self._session_signals = 0
         self._session_trades = 0
-        self._session_start = datetime.now(timezone.utc)
+        self._session_start = datetime.now(timezone.utc).isoformat()
+        self._session_start_mono = time.monotonic()  # For durations
 
     def log_signal(self, signal_data: dict[str, Any]) -> None:
         """Log a signal to file."""
         record = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._now_iso(),
             **signal_data,
         }
-        self._append_jsonl(self.signals_file, record)
+        self._signal_buf.append(_dumps(record) + b"\n")
         self._session_signals += 1
 
+        if len(self._signal_buf) >= self._buf_cap:
+            self._flush_signals()
+        if time.monotonic() - self._last_flush >= self._flush_interval:
+            self.flush()
+
     def log_trade(self, trade_data: dict[str, Any]) -> None:
         """Log a trade to file."""
         record = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._now_iso(),
             **trade_data,
         }
         self._append_jsonl(self.trades_file, record)
@@ -61,23 +142,58 @@ class PerformanceTracker:
     def log_portfolio(self, balances: dict[str, float], total_value: float) -> None:
         """Log portfolio snapshot."""
         record = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._now_iso(),
             "balances": balances,
             "total_value_usdt": total_value,
         }
         self._append_jsonl(self.portfolio_file, record)
 
+    def _now_iso(self) -> str:
+        """Current UTC time in ISO format (one clock read per millisecond)."""
+        now_ms = time.monotonic_ns() // 1_000_000
+        if now_ms != self._now_ms:
+            self._now_ms = now_ms
+            self._now_str = datetime.now(timezone.utc).isoformat()
+        return self._now_str
+
+    def _handle(self, file_path: Path) -> BinaryIO:
+        """Get the append handle for a file, opening it on first use."""
+        f = self._handles.get(file_path)
+        if f is None:
+            f = self._handles[file_path] = open(file_path, "ab", buffering=1 << 16)
+        return f
+
     def _append_jsonl(self, file_path: Path, record: dict) -> None:
-        """Append a JSON record to a JSONL file."""
-        with open(file_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(record) + "\n")
+        """Append a JSON record to a JSONL file (written through at once)."""
+        f = self._handle(file_path)
+        f.write(_dumps(record) + b"\n")
+        f.flush()  # Trades and snapshots are rare; keep them durable
+
+    def _flush_signals(self) -> None:
+        """Write batched signals in one call."""
+        if self._signal_buf:
+            self._handle(self.signals_file).write(b"".join(self._signal_buf))
+            self._signal_buf.clear()
+
+    def flush(self) -> None:
+        """Write buffered records to disk."""
+        self._flush_signals()
+        for f in self._handles.values():
+            f.flush()
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush and close all open files."""
+        self.flush()
+        for f in self._handles.values():
+            f.close()
+        self._handles.clear()
 
     def get_session_stats(self) -> dict[str, Any]:
         """Get current session statistics."""
-        duration = datetime.now(timezone.utc) - self._session_start
         return {
-            "session_start": self._session_start.isoformat(),
-            "duration_minutes": duration.total_seconds() / 60,
+            "session_start": self._session_start,
+            "duration_minutes": (time.monotonic() - self._session_start_mono) / 60,
             "signals_generated": self._session_signals,
             "trades_executed": self._session_trades,
         }
@@ -96,15 +212,15 @@ class PerformanceTracker:
 
     def _read_jsonl(self, file_path: Path) -> list[dict]:
         """Read all records from a JSONL file."""
+        # Buffered records must reach the file first
+        self.flush()
+
         if not file_path.exists():
             return []
 
-        records = []
-        with open(file_path, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    records.append(json.loads(line))
-        return records
+        # One read, then parse line by line
+        data = file_path.read_bytes()
+        return [_loads(line) for line in data.splitlines() if line.strip()]
 
     def get_performance_summary(self) -> dict[str, Any]:
         """Calculate performance summary from trade history."""
@@ -116,12 +232,18 @@ class PerformanceTracker:
                 "message": "No trades yet",
             }
 
-        buys = [t for t in trades if t.get("side") == "buy"]
-        sells = [t for t in trades if t.get("side") == "sell"]
+        # Columnar view of the trade records
+        n = len(trades)
+        sides = np.array([t.get("side") for t in trades], dtype=object)
+        costs = np.fromiter((t.get("cost", 0) for t in trades), dtype=np.float64, count=n)
+        fees = np.fromiter((t.get("fee", 0) for t in trades), dtype=np.float64, count=n)
+
+        buy_mask = sides == "buy"
+        sell_mask = sides == "sell"
 
-        total_bought = sum(t.get("cost", 0) for t in buys)
-        total_sold = sum(t.get("cost", 0) for t in sells)
-        total_fees = sum(t.get("fee", 0) for t in trades)
+        total_bought = float(costs[buy_mask].sum())
+        total_sold = float(costs[sell_mask].sum())
+        total_fees = float(fees.sum())
 
         # Get portfolio history for P&L
         portfolio = self.get_portfolio_history()
@@ -134,8 +256,8 @@ class PerformanceTracker:
 
         return {
             "total_trades": len(trades),
-            "buys": len(buys),
-            "sells": len(sells),
+            "buys": int(buy_mask.sum()),
+            "sells": int(sell_mask.sum()),
             "total_bought_usdt": total_bought,
             "total_sold_usdt": total_sold,
             "total_fees_usdt": total_fees,
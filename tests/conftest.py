@@ -0,0 +1,30 @@
+"""Shared test fixtures."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+
+def _make_ohlcv(n: int, seed: int = 0) -> pd.DataFrame:
+    """Random-walk hourly candles (float64, UTC index)."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    high = close * (1 + np.abs(rng.normal(0, 0.006, n)))
+    low = close * (1 - np.abs(rng.normal(0, 0.006, n)))
+    index = pd.date_range("2024-01-01", periods=n, freq="h", tz="UTC", name="timestamp")
+    return pd.DataFrame(
+        {
+            "open": np.r_[close[0], close[:-1]],
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": rng.uniform(1, 10, n),
+        },
+        index=index,
+    )
+
+
+@pytest.fixture
+def make_ohlcv():
+    """Factory for synthetic OHLCV frames: make_ohlcv(n, seed)."""
+    return _make_ohlcv
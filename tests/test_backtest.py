@@ -0,0 +1,29 @@
+"""Backtest engine."""
+
+import numpy as np
+
+from dreampivot.core.backtest import _run_backtest_numba
+
+
+def test_compiled_loop_matches_python(make_ohlcv):
+    df = make_ohlcv(400, 5)
+    signals = np.random.default_rng(0).choice(np.array([-1, 0, 1], dtype=np.int8), len(df))
+    args = (
+        df["high"].to_numpy(),
+        df["low"].to_numpy(),
+        df["close"].to_numpy(),
+        signals,
+        50,
+        10000.0,
+        0.05,
+        0.001,
+        0.02,
+        0.04,
+    )
+
+    compiled = _run_backtest_numba(*args)
+    python = getattr(_run_backtest_numba, "py_func", _run_backtest_numba)(*args)
+
+    assert len(compiled[0]) > 0
+    for got, expected in zip(compiled, python):
+        np.testing.assert_array_equal(got, expected)
@@ -0,0 +1,25 @@
+"""Trading engine."""
+
+import json
+import subprocess
+import sys
+
+
+def _loaded_after_import(module: str, candidates: list[str]) -> list[str]:
+    """Which of `candidates` a fresh interpreter has loaded after importing `module`."""
+    code = f"import json, sys, {module}; print(json.dumps([m for m in {candidates!r} if m in sys.modules]))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)
+
+
+def test_engine_import_defers_strategies():
+    loaded = _loaded_after_import(
+        "dreampivot.core.engine",
+        [
+            "dreampivot.strategies.momentum",
+            "dreampivot.strategies.mean_reversion",
+            "dreampivot.utils.indicators",
+            "numba",
+        ],
+    )
+    assert loaded == []
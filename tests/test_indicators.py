@@ -0,0 +1,56 @@
+"""Compiled indicator kernels against their pure-Python code and pandas."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dreampivot.utils import indicators
+
+
+# The Python body of a numba dispatcher (numba missing: already Python)
+def _python(kernel):
+    return getattr(kernel, "py_func", kernel)
+
+
+@pytest.fixture
+def close(make_ohlcv):
+    return make_ohlcv(300, 4)["close"].to_numpy()
+
+
+def test_ewm_matches_pandas(close):
+    expected = pd.Series(close).ewm(alpha=0.2, adjust=False).mean().to_numpy()
+
+    np.testing.assert_allclose(indicators.ewm(close, 0.2), expected, rtol=1e-12)
+    np.testing.assert_array_equal(indicators.ewm(close, 0.2), _python(indicators.ewm)(close, 0.2))
+
+
+def test_rsi_matches_pandas(close):
+    # Simple-mean RSI, 50 when there are no losses
+    delta = pd.Series(close).diff()
+    avg_gain = delta.where(delta > 0, 0.0).rolling(14, min_periods=1).mean()
+    avg_loss = (-delta).where(delta < 0, 0.0).rolling(14, min_periods=1).mean()
+    expected = (100 - 100 / (1 + avg_gain / avg_loss.replace(0, np.nan))).fillna(50).to_numpy()
+
+    series = indicators.rsi_series(close, 14)
+    np.testing.assert_allclose(series, expected, rtol=1e-9)
+    np.testing.assert_array_equal(series, _python(indicators.rsi_series)(close, 14))
+    assert series[-1] == indicators.rsi_last(close, 14)
+    assert indicators.rsi_last(np.full(30, 5.0), 14) == 50.0
+
+
+def test_ewm_last2_matches_ewm(close):
+    prev, curr = indicators.ewm_last2(close, 0.2)
+
+    assert (prev, curr) == tuple(indicators.ewm(close, 0.2)[-2:])
+    assert (prev, curr) == _python(indicators.ewm_last2)(close, 0.2)
+    assert indicators.ewm_last2(close[:1], 0.2) == (close[0], close[0])
+
+
+def test_mean_std_matches_numpy(close):
+    window = close[-20:]
+    mean, std = indicators.mean_std(window)
+
+    assert mean == pytest.approx(window.mean(), rel=1e-12)
+    assert std == pytest.approx(window.std(ddof=1), rel=1e-9)
+    assert (mean, std) == _python(indicators.mean_std)(window)
+    assert np.isnan(indicators.mean_std(window[:1])[1])
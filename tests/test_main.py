@@ -0,0 +1,80 @@
+"""Backtest entry point."""
+
+import asyncio
+
+import pytest
+
+import dreampivot.main as main_module
+from dreampivot.exchanges.base import BaseExchange
+
+
+class CandleFeed(BaseExchange):
+    """Stand-in exchange serving fixed candles per symbol."""
+
+    def __init__(self, frames: dict):
+        super().__init__()
+        self._name = "feed"
+        self.frames = frames
+        self.disconnected = False
+
+    async def connect(self) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        self.disconnected = True
+
+    async def get_ticker(self, symbol):
+        raise NotImplementedError
+
+    async def get_ohlcv(self, symbol, timeframe="1h", limit=100):
+        raise NotImplementedError
+
+    async def get_ohlcv_frame(self, symbol, timeframe="1h", limit=100, dtype="float32"):
+        frame = self.frames[symbol]
+        if isinstance(frame, BaseException):
+            raise frame
+        return frame.iloc[-limit:].astype(dtype)
+
+    async def get_balance(self, currency=None):
+        return []
+
+    async def create_order(self, *args, **kwargs):
+        raise NotImplementedError
+
+    async def cancel_order(self, order_id, symbol):
+        return False
+
+    async def get_order(self, order_id, symbol):
+        raise NotImplementedError
+
+
+@pytest.fixture
+def feed(monkeypatch, make_ohlcv):
+    """Route run_backtest to a CandleFeed; set feed.frames per test."""
+    exchange = CandleFeed({})
+    monkeypatch.setattr(main_module, "create_exchange", lambda **kwargs: exchange)
+    monkeypatch.setattr(
+        main_module,
+        "load_config",
+        lambda: {"symbols": ["BTC/USDT", "BAD/USDT"], "log_level": "WARNING"},
+    )
+    exchange.frames["BTC/USDT"] = make_ohlcv(720, 1)
+    return exchange
+
+
+def test_failed_symbol_is_reported_not_raised(feed, capsys):
+    feed.frames["BAD/USDT"] = RuntimeError("boom")
+
+    asyncio.run(main_module.run_backtest(days=30, compare=True))
+
+    out = capsys.readouterr().out
+    assert "BTC/USDT" in out and "BAD/USDT" not in out
+    assert feed.disconnected
+
+
+def test_cancelled_fetch_cancels_backtest(feed):
+    feed.frames["BAD/USDT"] = asyncio.CancelledError()
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(main_module.run_backtest(days=30, compare=True))
+    assert feed.disconnected
@@ -0,0 +1,143 @@
+"""Paper exchange balance and trade accounting."""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from dreampivot.exchanges.base import BaseExchange, Ticker
+from dreampivot.exchanges.paper import PaperExchange
+
+
+class PriceFeed(BaseExchange):
+    """Stand-in real exchange that only quotes a settable price."""
+
+    def __init__(self, price: float = 100.0):
+        super().__init__()
+        self._name = "feed"
+        self.price = price
+        self.ticker_calls = 0
+
+    async def connect(self) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+    async def get_ticker(self, symbol: str) -> Ticker:
+        self.ticker_calls += 1
+        return Ticker(symbol, self.price, self.price, self.price, 0.0, datetime.now(timezone.utc))
+
+    async def get_ohlcv(self, symbol, timeframe="1h", limit=100):
+        raise NotImplementedError
+
+    async def get_balance(self, currency=None):
+        return []
+
+    async def create_order(self, *args, **kwargs):
+        raise NotImplementedError
+
+    async def cancel_order(self, order_id, symbol):
+        return False
+
+    async def get_order(self, order_id, symbol):
+        raise NotImplementedError
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def _traded_paper() -> PaperExchange:
+    """Paper account after more trades than the initial array capacity (256)."""
+    feed = PriceFeed()
+    paper = PaperExchange(feed, initial_balance=1e7, fee_rate=0.001)
+
+    async def trade():
+        for i in range(300):
+            feed.price = 100.0 + i
+            await paper.create_order("BTC/USDT", "buy", "market", 1.0)
+            if i % 3 == 0:
+                await paper.create_order("BTC/USDT", "sell", "market", 0.5)
+
+    _run(trade())
+    return paper
+
+
+def _expected_usdt(history: list[dict]) -> float:
+    return (
+        1e7
+        - sum(t["cost"] + t["fee"] for t in history if t["side"] == "buy")
+        + sum(t["cost"] - t["fee"] for t in history if t["side"] == "sell")
+    )
+
+
+def test_trade_history_past_array_growth():
+    paper = _traded_paper()
+    history = paper.get_trade_history()
+
+    assert len(history) == 400
+    assert history[0]["price"] == 100.0 and history[-1]["price"] == 399.0
+    assert [t["side"] for t in history[:3]] == ["buy", "sell", "buy"]
+
+    balances = _run(paper.get_balances_map())
+    assert balances["USDT"].free == pytest.approx(_expected_usdt(history))
+    assert balances["BTC"].total == pytest.approx(300 - 50)
+
+
+def test_balances_are_snapshots():
+    paper = PaperExchange(PriceFeed(), initial_balance=1000.0)
+
+    held = _run(paper.get_balance("USDT"))[0]
+    _run(paper.create_order("BTC/USDT", "buy", "market", 1.0))
+
+    assert held.free == 1000.0
+    assert _run(paper.get_balance("USDT"))[0].free < 1000.0
+
+
+def test_stats_running_totals():
+    paper = _traded_paper()
+    history = paper.get_trade_history()
+    stats = paper.get_stats()
+
+    assert stats["total_trades"] == 400
+    assert (stats["buys"], stats["sells"]) == (300, 100)
+    assert stats["total_volume"] == pytest.approx(sum(t["cost"] for t in history))
+    assert stats["total_fees"] == pytest.approx(sum(t["fee"] for t in history))
+
+
+def test_order_prices_and_errors():
+    feed = PriceFeed(price=50.0)
+    paper = PaperExchange(feed, initial_balance=1000.0, fee_rate=0.0)
+
+    order = _run(paper.create_order("BTC/USDT", "buy", "market", 1.0, last_price=40.0))
+    assert order.price == 40.0 and feed.ticker_calls == 0
+
+    order = _run(paper.create_order("BTC/USDT", "buy", "limit", 1.0, price=30.0))
+    assert order.price == 30.0 and feed.ticker_calls == 0
+
+    with pytest.raises(ValueError):
+        _run(paper.create_order("BTC/USDT", "buy", "limit", 1.0))
+    with pytest.raises(ValueError):
+        _run(paper.create_order("BTC/USDT", "sell", "market", 5.0))
+    with pytest.raises(ValueError):
+        _run(paper.create_order("BTC/USDT", "buy", "market", 100.0))
+
+
+def test_trade_frame_matches_history():
+    paper = _traded_paper()
+    history = paper.get_trade_history()
+    frame = paper.get_trade_frame()
+
+    assert list(frame.columns) == list(history[0])
+    assert len(frame) == len(history)
+    assert frame["cost"].tolist() == [t["cost"] for t in history]
+    assert frame["side"].tolist() == [t["side"] for t in history]
+
+
+def test_portfolio_value():
+    paper = _traded_paper()
+    usdt = _expected_usdt(paper.get_trade_history())
+
+    assert paper.get_portfolio_value({"BTC": 2.0}) == pytest.approx(usdt + 250 * 2.0)
+    assert paper.get_portfolio_value({}) == pytest.approx(usdt)  # Unpriced count as zero
@@ -0,0 +1,90 @@
+"""Equivalence of the full, vectorized and streaming strategy paths."""
+
+import numpy as np
+import pytest
+
+from dreampivot.strategies.base import BaseStrategy
+from dreampivot.strategies.mean_reversion import MeanReversionStrategy
+from dreampivot.strategies.momentum import MomentumStrategy
+
+STRATEGIES = [
+    MomentumStrategy,
+    MeanReversionStrategy,
+    lambda: MeanReversionStrategy({"bb_std": 1.0, "rsi_oversold": 45, "rsi_overbought": 55}),
+]
+
+
+@pytest.mark.parametrize("make_strategy", STRATEGIES)
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_analyze_series_matches_per_candle(make_strategy, seed, make_ohlcv):
+    strategy = make_strategy()
+    df = make_ohlcv(600, seed)
+
+    signals, confidences, reasons = strategy.analyze_series(df, "X")
+    ref_signals, ref_confidences, ref_reasons = BaseStrategy.analyze_series(strategy, df, "X")
+
+    np.testing.assert_array_equal(signals, ref_signals)
+    np.testing.assert_array_equal(reasons, ref_reasons)
+    np.testing.assert_allclose(confidences, ref_confidences, rtol=1e-6)
+
+    # analyze on a history prefix agrees with the precomputed path
+    for i in (strategy.required_history() - 1, 300, len(df) - 1):
+        assert strategy.analyze(df.iloc[:i + 1], "X").reason == reasons[i]
+
+
+@pytest.mark.parametrize("make_strategy", STRATEGIES)
+def test_float32_frame_matches_float64(make_strategy, make_ohlcv):
+    strategy = make_strategy()
+    df = make_ohlcv(500, 2).astype("float32")
+
+    # Backtests load float32 candles; precompute must match analyze on them
+    _, _, reasons = strategy.analyze_series(df, "X")
+    for i in range(strategy.required_history(), len(df), 25):
+        assert strategy.analyze(df.iloc[:i + 1], "X").reason == reasons[i]
+
+
+def _assert_same_signal(a, b):
+    assert a.signal == b.signal
+    assert a.reason == b.reason
+    assert a.confidence == pytest.approx(b.confidence)
+    assert a.metadata.keys() == b.metadata.keys()
+    for key, value in a.metadata.items():
+        if isinstance(value, str):
+            assert value == b.metadata[key]
+        else:
+            np.testing.assert_allclose(value, b.metadata[key], rtol=1e-9, atol=1e-9)
+
+
+@pytest.mark.parametrize("make_strategy", STRATEGIES)
+@pytest.mark.parametrize("seed", [0, 3])
+def test_update_incremental_matches_analyze(make_strategy, seed, make_ohlcv):
+    strategy = make_strategy()
+    df = make_ohlcv(400, seed)
+    window = strategy.required_history() + 10  # Same window as the engine
+
+    # EMAs are seeded where the first window starts, so compare against
+    # analyze over the history from that candle on
+    state = {}
+    for t in range(window - 1, len(df)):
+        streamed = strategy.update_incremental(state, df.iloc[t - window + 1:t + 1], "X")
+        _assert_same_signal(streamed, strategy.analyze(df.iloc[:t + 1], "X"))
+
+
+@pytest.mark.parametrize("make_strategy", STRATEGIES)
+def test_update_incremental_revised_candle(make_strategy, make_ohlcv):
+    strategy = make_strategy()
+    df = make_ohlcv(400, 1)
+    window = strategy.required_history() + 10
+
+    # A forming candle seen with a different close must not leak into state
+    revised, clean = {}, {}
+    for t in range(window - 1, len(df)):
+        win = df.iloc[t - window + 1:t + 1]
+        bogus = win.copy()
+        bogus.iloc[-1, bogus.columns.get_loc("close")] *= 1.05
+
+        strategy.update_incremental(revised, bogus, "X")
+        _assert_same_signal(
+            strategy.update_incremental(revised, win, "X"),
+            strategy.update_incremental(clean, win, "X"),
+        )
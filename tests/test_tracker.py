@@ -0,0 +1,110 @@
+"""Performance tracker JSONL round-trips."""
+
+import gc
+import math
+import weakref
+
+import pytest
+
+from dreampivot.utils import tracker as tracker_module
+from dreampivot.utils.tracker import PerformanceTracker
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Run with orjson (when installed) and with the json fallback."""
+    if request.param == "orjson":
+        if tracker_module.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(tracker_module, "orjson", None)
+    return request.param
+
+
+def test_signal_round_trip_with_nan(backend, tmp_path):
+    tracker = PerformanceTracker(str(tmp_path))
+    tracker.log_signal({"symbol": "X", "indicators": {"band_position": math.nan, "rsi": 50.5}})
+    tracker.log_signal({"symbol": "Y", "values": [math.inf, 1.0]})
+
+    signals = tracker.get_all_signals()
+    tracker.close()
+
+    # Non-finite values are stored as null by both encoders
+    assert [s["symbol"] for s in signals] == ["X", "Y"]
+    assert signals[0]["indicators"] == {"band_position": None, "rsi": 50.5}
+    assert signals[1]["values"] == [None, 1.0]
+    assert b"NaN" not in tracker.signals_file.read_bytes()
+
+
+def test_signals_flush_on_cap(monkeypatch, tmp_path):
+    monkeypatch.setenv("DREAMPIVOT_LOG_BUF", "3")
+    tracker = PerformanceTracker(str(tmp_path))
+
+    tracker.log_signal({"n": 1})
+    tracker.log_signal({"n": 2})
+    assert not tracker.signals_file.exists()
+
+    tracker.log_signal({"n": 3})
+    tracker.close()
+    assert tracker.signals_file.read_bytes().count(b"\n") == 3
+
+
+def test_reads_legacy_nan_lines(backend, tmp_path):
+    # Files written by json.dumps before null encoding hold bare NaN
+    (tmp_path / "signals.jsonl").write_bytes(
+        b'{"band_position": NaN, "symbol": "X"}\n{"symbol": "Y"}\n'
+    )
+
+    tracker = PerformanceTracker(str(tmp_path))
+    signals = tracker.get_all_signals()
+    tracker.close()
+
+    assert math.isnan(signals[0]["band_position"])
+    assert signals[1] == {"symbol": "Y"}
+
+
+def test_trades_and_summary(backend, tmp_path):
+    tracker = PerformanceTracker(str(tmp_path))
+    tracker.log_trade({"symbol": "X", "side": "buy", "cost": 100.0, "fee": 0.1})
+    tracker.log_trade({"symbol": "X", "side": "sell", "cost": 110.0, "fee": 0.11})
+    tracker.log_portfolio({"USDT": 10000.0}, 10000.0)
+    tracker.log_portfolio({"USDT": 10010.0}, 10010.0)
+
+    summary = tracker.get_performance_summary()
+    tracker.close()
+
+    assert summary["total_trades"] == 2
+    assert (summary["buys"], summary["sells"]) == (1, 1)
+    assert summary["total_fees_usdt"] == pytest.approx(0.21)
+    assert summary["pnl_usdt"] == pytest.approx(10.0)
+
+
+def test_trades_and_snapshots_written_through(tmp_path):
+    tracker = PerformanceTracker(str(tmp_path))
+    tracker.log_trade({"symbol": "X", "side": "buy", "cost": 100.0})
+    tracker.log_portfolio({"USDT": 9900.0}, 9900.0)
+
+    # On disk without any explicit flush
+    assert tracker.trades_file.read_bytes().count(b"\n") == 1
+    assert tracker.portfolio_file.read_bytes().count(b"\n") == 1
+    tracker.close()
+
+
+def test_exit_flush_after_close(tmp_path):
+    tracker = PerformanceTracker(str(tmp_path))
+    tracker.close()
+
+    # A restarted engine keeps logging on the closed tracker
+    tracker.log_signal({"n": 1})
+    tracker_module._flush_all()
+    assert tracker.signals_file.read_bytes().count(b"\n") == 1
+    tracker.close()
+
+
+def test_closed_tracker_is_freed(tmp_path):
+    tracker = PerformanceTracker(str(tmp_path))
+    tracker.close()
+    ref = weakref.ref(tracker)
+    del tracker
+    gc.collect()
+    assert ref() is None